@@ -4,7 +4,7 @@ Simple AI opponent for single-player Pong.
 """
 
 import random
-from config import GAME_HEIGHT, PADDLE_HEIGHT
+from config import PADDLE_HEIGHT
 
 
 class AIController:
@@ -29,17 +29,21 @@ class AIController:
         }
     }
     
-    def __init__(self, difficulty='medium'):
-        """Initialize AI with specified difficulty."""
+    def __init__(self, difficulty='medium', player_id=2):
+        """Initialize AI with specified difficulty, controlling paddle player_id."""
         self.difficulty = difficulty
+        self.player_id = player_id
         self.settings = self.DIFFICULTY_SETTINGS.get(difficulty, self.DIFFICULTY_SETTINGS['medium'])
-        self.target_y = GAME_HEIGHT // 2
+        self.target_y = None           # Set from the field on the first update
     
     def update(self, state):
         """
         Calculate AI move based on ball position.
         Returns 'W' (up), 'S' (down), or None (no move).
         """
+        if self.target_y is None:
+            self.target_y = state.height // 2
+        
         # Check if AI should react this frame
         if random.random() > self.settings['reaction_chance']:
             return None
@@ -50,22 +54,30 @@ class AIController:
         ball_x = state.ball_x
         ball_vx = state.ball_vx
         
-        # Only track ball when it's coming towards AI (right side)
-        if ball_vx > 0:
+        if self.player_id == 2:
+            paddle_x = state.paddle2_x
+            paddle_y = state.paddle2_y
+            coming = ball_vx > 0
+        else:
+            paddle_x = state.paddle1_x
+            paddle_y = state.paddle1_y
+            coming = ball_vx < 0
+        
+        # Only track ball when it's coming towards AI
+        if coming:
             # Simple prediction: where will ball be when it reaches paddle
-            from config import GAME_WIDTH
-            paddle_x = GAME_WIDTH - 3
+            field_height = state.height
             
             if ball_vx != 0:
                 time_to_reach = (paddle_x - ball_x) / ball_vx
                 predicted_y = ball_y + (ball_vy * time_to_reach)
                 
                 # Handle bounces (simplified)
-                while predicted_y < 0 or predicted_y >= GAME_HEIGHT:
+                while predicted_y < 0 or predicted_y >= field_height:
                     if predicted_y < 0:
                         predicted_y = -predicted_y
-                    elif predicted_y >= GAME_HEIGHT:
-                        predicted_y = 2 * (GAME_HEIGHT - 1) - predicted_y
+                    elif predicted_y >= field_height:
+                        predicted_y = 2 * (field_height - 1) - predicted_y
                 
                 # Add prediction error based on difficulty
                 error = random.uniform(-self.settings['prediction_error'], 
@@ -73,10 +85,10 @@ class AIController:
                 self.target_y = predicted_y + error
         else:
             # Ball going away, move to center
-            self.target_y = GAME_HEIGHT // 2
+            self.target_y = state.height // 2
         
         # Move paddle towards target
-        paddle_center = state.paddle2_y + PADDLE_HEIGHT // 2
+        paddle_center = paddle_y + PADDLE_HEIGHT // 2
         
         if paddle_center < self.target_y - 1:
             return 'S'  # Move down
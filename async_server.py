@@ -0,0 +1,283 @@
+"""
+Async Game Server Module
+asyncio version of GameServer: one event loop owns the lobby and game
+state, so there are no locks and no thread per client. Speaks the same
+protocol as server.py.
+"""
+
+import asyncio
+import threading
+import logging
+
+from config import PORT, GAME_WIDTH, GAME_HEIGHT
+from game_state import GameState, LobbyState
+from physics import update_physics, move_paddle
+from timestep import FixedTimestep
+from clock import get_clock, RealClock
+from protocol import SnapshotEncoder, hello_message, snapshot_fields
+from server import get_local_ip, negotiate_version, lobby_state_message
+
+logger = logging.getLogger(__name__)
+
+# Game states are not queued for a client with more unsent data than
+# this (a stalled client skips frames instead of growing the buffer)
+MAX_PENDING_BYTES = 64 * 1024
+
+
+class AsyncGameServer:
+    """
+    TCP Server that manages lobby and game on an asyncio event loop.
+
+    Use serve() inside a running loop (several servers can share one
+    loop), or start()/stop() to run it on a background thread like
+    GameServer.
+    """
+
+    def __init__(self, width=GAME_WIDTH, height=GAME_HEIGHT, clock=None, port=PORT):
+        self.clock = clock or get_clock()
+        self.port = port
+        self.game_state = GameState(width, height)
+        self.lobby_state = LobbyState()
+        self.writers = {}              # player_id -> StreamWriter
+        self.encoders = {}             # player_id -> SnapshotEncoder (binary clients only)
+        self.next_player_id = 1
+        self.tick = 0                  # Simulation ticks, never reset so snapshot ticks stay unique
+        self.running = True
+        self.in_lobby = True
+        self.game_running = False
+        self.game_task = None
+        self.loop = None
+        self.server = None
+        self._stopped = None
+        self._thread = None
+
+    def get_local_ip(self):
+        """Get the local LAN IP address."""
+        return get_local_ip()
+
+    async def serve(self, ready=None):
+        """
+        Accept clients until stop() is called.
+
+        Args:
+            ready: Optional threading.Event set once the socket is listening
+        """
+        self.loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        try:
+            self.server = await asyncio.start_server(
+                self.handle_client, '0.0.0.0', self.port, reuse_address=True)
+        except OSError as e:
+            logger.error(f"Failed to start server: {e}")
+            raise
+        finally:
+            if ready:
+                ready.set()
+        logger.info(f"Server started on {self.get_local_ip()}:{self.port}")
+
+        async with self.server:
+            await self._stopped.wait()
+        if self.game_task:
+            self.game_task.cancel()
+        for writer in list(self.writers.values()):
+            writer.close()
+
+    def start(self):
+        """
+        Run the server on a background thread.
+
+        Returns:
+            Local LAN IP address
+        """
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(ready,))
+        self._thread.daemon = True
+        self._thread.start()
+        ready.wait()
+        if self.server is None:
+            raise OSError(f"Failed to start server on port {self.port}")
+        return self.get_local_ip()
+
+    def _run(self, ready):
+        """Background thread: run serve() on its own event loop."""
+        try:
+            asyncio.run(self.serve(ready))
+        except OSError:
+            pass  # Already logged; start() raises on the caller's thread
+
+    async def handle_client(self, reader, writer):
+        """Handle one client connection."""
+        if self.next_player_id > 2:
+            writer.close()
+            return
+        player_id = self.next_player_id
+        self.next_player_id += 1
+
+        addr = writer.get_extra_info('peername')
+        self.writers[player_id] = writer
+        self.lobby_state.players_connected[player_id - 1] = True
+        logger.info(f"Player {player_id} connected from {addr[0]}:{addr[1]}")
+        writer.write(f"PLAYER,{player_id}".encode())
+
+        if player_id == 2:
+            logger.info("All players connected! Entering lobby...")
+            self.broadcast("LOBBY_READY")
+            self.broadcast_lobby_state()
+
+        try:
+            while self.running:
+                line = await reader.readline()
+                if not line:
+                    break
+                message = line.decode(errors='replace').rstrip('\n')
+                if message:
+                    self.process_message(message, player_id)
+        except ConnectionResetError:
+            logger.warning(f"Player {player_id} connection reset")
+        except Exception as e:
+            if self.running:
+                logger.debug(f"Client {player_id} error: {e}")
+
+        logger.info(f"Player {player_id} disconnected")
+        self.lobby_state.players_connected[player_id - 1] = False
+        self.writers.pop(player_id, None)
+        self.encoders.pop(player_id, None)
+        writer.close()
+
+    def process_message(self, message, player_id):
+        """Process a single message from client."""
+        logger.debug(f"P{player_id}: {message}")
+
+        if message.startswith("HELLO,"):
+            version = negotiate_version(message)
+            self.send_to(player_id, hello_message(version))
+            if version:
+                self.encoders[player_id] = SnapshotEncoder(version)
+            else:
+                self.encoders.pop(player_id, None)
+            logger.info(f"Player {player_id} uses protocol version {version}")
+
+        elif message.startswith("ACK,"):
+            encoder = self.encoders.get(player_id)
+            if encoder:
+                try:
+                    encoder.acknowledge(int(message[4:]))
+                except ValueError:
+                    pass
+
+        elif message.startswith("CHAT,"):
+            self.lobby_state.add_message(player_id, message[5:])
+            self.broadcast_lobby_state()
+
+        elif message.startswith("INPUT,"):
+            parts = message.split(',')
+            if len(parts) >= 2 and parts[1] in ['W', 'S']:
+                move_paddle(self.game_state, player_id, parts[1])
+
+        elif message == "START_GAME" and player_id == 1:
+            if not self.game_running:
+                self.game_running = True
+                self.game_task = asyncio.create_task(self.start_game())
+
+    def send_to(self, player_id, message):
+        """Send a text message to one client."""
+        writer = self.writers.get(player_id)
+        if writer and not writer.is_closing():
+            writer.write((message + "\n").encode())
+
+    def broadcast(self, message):
+        """Send message to all clients."""
+        data = (message + "\n").encode()
+        for writer in list(self.writers.values()):
+            if not writer.is_closing():
+                writer.write(data)
+
+    def broadcast_state(self):
+        """Send the game state to all clients, in the format each negotiated."""
+        text_data = (self.game_state.serialize() + "\n").encode()
+        fields = snapshot_fields(self.game_state)
+        for player_id, writer in list(self.writers.items()):
+            if writer.is_closing() or writer.transport.get_write_buffer_size() > MAX_PENDING_BYTES:
+                continue
+            encoder = self.encoders.get(player_id)
+            writer.write(encoder.encode(fields, self.tick) if encoder else text_data)
+
+    def broadcast_lobby_state(self):
+        """Send lobby state to all clients."""
+        self.broadcast(lobby_state_message(self.lobby_state))
+
+    async def sleep(self, seconds):
+        """Wait on the event loop (a virtual clock is advanced instead)."""
+        if isinstance(self.clock, RealClock):
+            await asyncio.sleep(seconds)
+        else:
+            self.clock.sleep(seconds)
+            await asyncio.sleep(0)
+
+    async def start_game(self):
+        """Start the game from lobby."""
+        logger.info("Starting game...")
+
+        self.in_lobby = False
+        self.game_running = True
+        self.game_state.reset()
+
+        self.broadcast("GAME_START")
+        await self.sleep(0.5)
+
+        await self.run_game_loop()
+
+        # Save game result to lobby state
+        self.lobby_state.last_winner = self.game_state.winner
+        self.lobby_state.last_score1 = self.game_state.score1
+        self.lobby_state.last_score2 = self.game_state.score2
+        self.in_lobby = True
+        self.game_running = False
+
+        logger.info(f"Game ended. Winner: Player {self.game_state.winner}")
+
+        await self.sleep(3)
+        self.broadcast("RETURN_LOBBY")
+        self.broadcast_lobby_state()
+
+    async def run_game_loop(self):
+        """
+        Main game physics loop, as a task on the event loop.
+
+        Physics runs on a fixed timestep; if the loop wakes late it catches
+        up with several steps and broadcasts only the latest state.
+        """
+        logger.debug("Game loop started")
+
+        timestep = FixedTimestep()
+        timestep.advance(self.clock.now())
+
+        while self.game_state.running and self.running:
+            await self.sleep(timestep.time_until_step())
+            steps = timestep.advance(self.clock.now())
+            if not steps:
+                continue
+
+            for _ in range(steps):
+                update_physics(self.game_state)
+                self.tick += 1
+                if not self.game_state.running:
+                    break
+
+            self.broadcast_state()
+
+            if not self.game_state.running:
+                self.broadcast(f"GAMEOVER,{self.game_state.winner}")
+                break
+
+        logger.debug("Game loop ended")
+
+    def stop(self):
+        """Stop the server gracefully (safe to call from any thread)."""
+        logger.info("Stopping server...")
+        self.running = False
+        if self.loop and self._stopped:
+            self.loop.call_soon_threadsafe(self._stopped.set)
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        logger.info("Server stopped")
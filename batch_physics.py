@@ -0,0 +1,305 @@
+"""
+Batch Physics Module
+NumPy version of physics.py that steps many matches at once, for AI
+evaluation and difficulty tuning. Requires NumPy.
+
+Every function mirrors its scalar counterpart in physics.py operation for
+operation, so a batch of N matches produces exactly the same positions,
+velocities and scores as N scalar GameStates stepped with the same
+inputs and the same random ball directions.
+"""
+
+import random
+
+import numpy as np
+
+from config import (
+    GAME_WIDTH, GAME_HEIGHT, PADDLE_HEIGHT, WIN_SCORE,
+    BALL_SPEED_X, BALL_SPEED_Y
+)
+from physics import MAX_COLLISIONS_PER_TICK
+from ai import AIController
+
+
+# Paddle directions for move_paddle (scalar 'W' / 'S')
+UP = -1
+DOWN = 1
+STAY = 0
+
+
+def random_signs(mask):
+    """Default sign source: a random -1 or 1 per selected match (Python random, like physics.py)."""
+    return np.array([random.choice([-1, 1]) for _ in range(int(mask.sum()))], dtype=np.float64)
+
+
+class BatchState:
+    """
+    State of N matches on fields of the same size, one array per field.
+
+    Mirrors GameState: ball_x, ball_y, ball_vx, ball_vy, prev_ball_x,
+    prev_ball_y, paddle1_y, paddle2_y, paddle1_height, paddle2_height,
+    score1, score2, running and winner (0 = none).
+
+    Random ball directions come from sign_source(mask), which returns -1
+    or 1 for each match selected by the boolean mask, in match order.
+    Inject one to reproduce scalar matches (e.g. one random.Random per
+    match) or to draw from a NumPy generator.
+    """
+
+    def __init__(self, count, width=GAME_WIDTH, height=GAME_HEIGHT, sign_source=random_signs):
+        self.count = count
+        self.width = width
+        self.height = height
+        self.paddle1_x = 2
+        self.paddle2_x = width - 3
+        self.sign_source = sign_source
+
+        self.ball_x = np.zeros(count)
+        self.ball_y = np.zeros(count)
+        self.ball_vx = np.zeros(count)
+        self.ball_vy = np.zeros(count)
+        self.prev_ball_x = np.zeros(count)
+        self.prev_ball_y = np.zeros(count)
+        self.paddle1_y = np.zeros(count, dtype=np.int64)
+        self.paddle2_y = np.zeros(count, dtype=np.int64)
+        self.paddle1_height = np.zeros(count, dtype=np.int64)
+        self.paddle2_height = np.zeros(count, dtype=np.int64)
+        self.score1 = np.zeros(count, dtype=np.int64)
+        self.score2 = np.zeros(count, dtype=np.int64)
+        self.running = np.zeros(count, dtype=bool)
+        self.winner = np.zeros(count, dtype=np.int64)
+        self.reset()
+
+    def reset(self, mask=None):
+        """Reset matches (all, or where mask is True) to the initial state."""
+        if mask is None:
+            mask = np.ones(self.count, dtype=bool)
+        if not mask.any():
+            return
+        self.ball_x[mask] = self.width // 2
+        self.ball_y[mask] = self.height // 2
+        # Same draw order as GameState.reset: vx sign, then vy sign
+        self.ball_vx[mask] = BALL_SPEED_X * self.sign_source(mask)
+        self.ball_vy[mask] = BALL_SPEED_Y * self.sign_source(mask)
+        self.prev_ball_x[mask] = self.ball_x[mask]
+        self.prev_ball_y[mask] = self.ball_y[mask]
+        self.paddle1_y[mask] = self.height // 2 - PADDLE_HEIGHT // 2
+        self.paddle2_y[mask] = self.height // 2 - PADDLE_HEIGHT // 2
+        self.paddle1_height[mask] = PADDLE_HEIGHT
+        self.paddle2_height[mask] = PADDLE_HEIGHT
+        self.score1[mask] = 0
+        self.score2[mask] = 0
+        self.running[mask] = True
+        self.winner[mask] = 0
+
+    def load(self, index, state):
+        """Copy a scalar GameState into match index."""
+        for name in ('ball_x', 'ball_y', 'ball_vx', 'ball_vy', 'prev_ball_x', 'prev_ball_y',
+                     'paddle1_y', 'paddle2_y', 'paddle1_height', 'paddle2_height',
+                     'score1', 'score2', 'running'):
+            getattr(self, name)[index] = getattr(state, name)
+        self.winner[index] = state.winner or 0
+
+    def store(self, index, state):
+        """Copy match index into a scalar GameState."""
+        for name in ('ball_x', 'ball_y', 'ball_vx', 'ball_vy', 'prev_ball_x', 'prev_ball_y'):
+            setattr(state, name, float(getattr(self, name)[index]))
+        for name in ('paddle1_y', 'paddle2_y', 'paddle1_height', 'paddle2_height',
+                     'score1', 'score2'):
+            setattr(state, name, int(getattr(self, name)[index]))
+        state.running = bool(self.running[index])
+        state.winner = int(self.winner[index]) or None
+
+
+class BatchEvents:
+    """Per-match physics events (boolean arrays; goal_scored is 0, 1 or 2)."""
+
+    def __init__(self, count):
+        self.wall_bounce = np.zeros(count, dtype=bool)
+        self.paddle1_hit = np.zeros(count, dtype=bool)
+        self.paddle2_hit = np.zeros(count, dtype=bool)
+        self.goal_scored = np.zeros(count, dtype=np.int64)
+
+
+def update_physics(batch, mask=None, return_events=False):
+    """
+    Step matches by one tick (physics.update_physics for every match).
+
+    Args:
+        batch: BatchState
+        mask: Matches to step (default: those still running)
+        return_events: If True, return BatchEvents
+
+    Returns:
+        BatchEvents if return_events=True, else None
+    """
+    if mask is None:
+        mask = batch.running.copy()
+    events = BatchEvents(batch.count) if return_events else None
+
+    batch.prev_ball_x[mask] = batch.ball_x[mask]
+    batch.prev_ball_y[mask] = batch.ball_y[mask]
+
+    top = 0.0
+    bottom = float(batch.height - 1)
+    left_plane = float(batch.paddle1_x + 1)
+    right_plane = float(batch.paddle2_x - 1)
+    paddle1_top = batch.paddle1_y
+    paddle1_bottom = batch.paddle1_y + batch.paddle1_height
+    paddle2_top = batch.paddle2_y
+    paddle2_bottom = batch.paddle2_y + batch.paddle2_height
+
+    x = batch.ball_x.copy()
+    y = batch.ball_y.copy()
+    remaining = np.ones(batch.count)
+    active = mask.copy()
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for _ in range(MAX_COLLISIONS_PER_TICK):
+            if not active.any():
+                break
+            vx = batch.ball_vx
+            vy = batch.ball_vy
+            end_x = x + vx * remaining
+            end_y = y + vy * remaining
+
+            # Top/Bottom walls
+            wall_top = active & (vy < 0) & (end_y <= top)
+            wall_bottom = active & (vy > 0) & (end_y >= bottom) & ~wall_top
+            wall = wall_top | wall_bottom
+            wall_time = np.where(wall_top, (top - y) / vy, (bottom - y) / vy)
+            wall_time = np.where(wall, np.maximum(0.0, wall_time), np.inf)
+
+            # Paddles: cross the plane from the front while covered
+            t1 = (left_plane - x) / vx
+            y1 = y + vy * t1
+            hit1 = (active & (vx < 0) & (x >= left_plane) & (end_x <= left_plane)
+                    & (t1 < wall_time) & (paddle1_top <= y1) & (y1 <= paddle1_bottom))
+            t2 = (right_plane - x) / vx
+            y2 = y + vy * t2
+            hit2 = (active & (vx > 0) & (x <= right_plane) & (end_x >= right_plane)
+                    & (t2 < wall_time) & (paddle2_top <= y2) & (y2 <= paddle2_bottom))
+            wall &= ~(hit1 | hit2)
+
+            impact = wall | hit1 | hit2
+            free = active & ~impact
+            x = np.where(free, end_x, x)
+            y = np.where(free, end_y, y)
+
+            # Move impacted balls to the point of impact and reflect
+            impact_time = np.where(hit1, t1, np.where(hit2, t2, wall_time))
+            x = np.where(impact, x + vx * impact_time, x)
+            y = np.where(impact, y + vy * impact_time, y)
+            remaining = np.where(impact, remaining - impact_time, remaining)
+
+            batch.ball_vy[:] = np.where(wall, -vy, vy)
+            y = np.where(wall, np.clip(y, top, bottom), y)
+            batch.ball_vx[:] = np.where(hit1 | hit2, -vx, vx)
+            x = np.where(hit1, left_plane, np.where(hit2, right_plane, x))
+
+            if events:
+                events.wall_bounce |= wall
+                events.paddle1_hit |= hit1
+                events.paddle2_hit |= hit2
+
+            active = impact & (remaining > 0)
+
+    batch.ball_x[mask] = x[mask]
+    batch.ball_y[mask] = np.clip(y, top, bottom)[mask]
+
+    # Scoring
+    goal2 = mask & (batch.ball_x <= 0)
+    goal1 = mask & ~goal2 & (batch.ball_x >= batch.width - 1)
+    batch.score2 += goal2
+    batch.score1 += goal1
+    if events:
+        events.goal_scored[goal2] = 2
+        events.goal_scored[goal1] = 1
+    # Both resets draw from sign_source in match order, like scalar goals
+    scored = goal1 | goal2
+    if scored.any():
+        reset_ball(batch, scored, np.where(goal2, 1.0, -1.0)[scored])
+
+    # Check win condition
+    won1 = mask & (batch.score1 >= WIN_SCORE)
+    won2 = mask & ~won1 & (batch.score2 >= WIN_SCORE)
+    batch.running[won1 | won2] = False
+    batch.winner[won1] = 1
+    batch.winner[won2] = 2
+
+    return events
+
+
+def reset_ball(batch, mask, directions):
+    """
+    Reset the ball to the center after scoring (physics.reset_ball).
+
+    Args:
+        batch: BatchState
+        mask: Matches whose ball is reset
+        directions: 1 or -1 per selected match (x direction)
+    """
+    batch.ball_x[mask] = batch.width // 2
+    batch.ball_y[mask] = batch.height // 2
+    batch.prev_ball_x[mask] = batch.ball_x[mask]
+    batch.prev_ball_y[mask] = batch.ball_y[mask]
+    batch.ball_vx[mask] = BALL_SPEED_X * directions
+    batch.ball_vy[mask] = BALL_SPEED_Y * batch.sign_source(mask)
+
+
+def move_paddle(batch, player_id, directions):
+    """
+    Move paddles up or down (physics.move_paddle).
+
+    Args:
+        batch: BatchState
+        player_id: 1 or 2
+        directions: Array of UP, DOWN or STAY per match
+    """
+    if player_id == 1:
+        paddle_y, paddle_height = batch.paddle1_y, batch.paddle1_height
+    else:
+        paddle_y, paddle_height = batch.paddle2_y, batch.paddle2_height
+    moved = np.where(directions == UP, np.maximum(0, paddle_y - 1), paddle_y)
+    moved = np.where(directions == DOWN, np.minimum(batch.height - paddle_height, paddle_y + 1), moved)
+    paddle_y[:] = moved
+
+
+def ai_moves(batch, difficulty='medium', rng=None):
+    """
+    Paddle 2 moves from AIController's strategy, for every match at once.
+
+    Uses the same settings and prediction as AIController.update, with
+    randomness drawn from a NumPy generator (so results match the scalar
+    AI in distribution, not draw for draw).
+
+    Returns:
+        Array of UP, DOWN or STAY per match
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    settings = AIController.DIFFICULTY_SETTINGS.get(
+        difficulty, AIController.DIFFICULTY_SETTINGS['medium'])
+    height = batch.height
+
+    react = rng.random(batch.count) <= settings['reaction_chance']
+    coming = batch.ball_vx > 0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        time_to_reach = (batch.paddle2_x - batch.ball_x) / batch.ball_vx
+    predicted = np.where(coming, batch.ball_y + batch.ball_vy * time_to_reach, 0.0)
+
+    # Handle bounces (simplified), as in AIController
+    outside = (predicted < 0) | (predicted >= height)
+    while outside.any():
+        predicted = np.where(predicted < 0, -predicted, predicted)
+        predicted = np.where(predicted >= height, 2 * (height - 1) - predicted, predicted)
+        outside = (predicted < 0) | (predicted >= height)
+
+    error = rng.uniform(-settings['prediction_error'], settings['prediction_error'], batch.count)
+    target = np.where(coming, predicted + error, height // 2)
+
+    paddle_center = batch.paddle2_y + PADDLE_HEIGHT // 2
+    moves = np.where(paddle_center < target - 1, DOWN,
+                     np.where(paddle_center > target + 1, UP, STAY))
+    return np.where(react, moves, STAY)
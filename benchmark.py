@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Renderer Benchmark
+Replays scripted game sequences through the renderers into a headless sink
+and reports frames/sec, bytes/frame and peak memory allocated per frame.
+
+Usage:
+    python benchmark.py                       # all renderers, /dev/null sink
+    python benchmark.py --frames 2000 --sink buffer
+    python benchmark.py --renderer game_effects lobby --json
+    python benchmark.py --field 300x100        # large arena
+"""
+
+import argparse
+import copy
+import json
+import random
+import time
+import tracemalloc
+
+import output
+from colors import enable_colors, disable_colors
+from config import PADDLE_HEIGHT, FRAME_TIME, GAME_WIDTH, GAME_HEIGHT
+from game_state import GameState, LobbyState
+from physics import update_physics, move_paddle, process_physics_events
+from ai import AIController
+from powerups import PowerUpManager
+from effects import EffectsManager
+from clock import VirtualClock
+from screen import invalidate_screen
+import renderer
+
+
+class RecordedFrame:
+    """One scripted frame: state plus what the managers looked like."""
+
+    def __init__(self, state, events, field_powerups, active_effects):
+        self.state = state
+        self.events = events
+        self.field_powerups = field_powerups
+        self.active_effects = active_effects
+
+    # PowerUpManager interface used by the renderer
+    def get_field_powerups(self):
+        return self.field_powerups
+
+    def get_active_effects(self):
+        return self.active_effects
+
+
+def record_match(frames, seed=0, difficulty='hard', width=GAME_WIDTH, height=GAME_HEIGHT):
+    """
+    Script a deterministic match (AI vs simple tracker) for replay.
+
+    Args:
+        frames: Number of frames to record
+        seed: Random seed
+        difficulty: AIController difficulty for player 2
+        width, height: Field size
+
+    Returns:
+        List of RecordedFrame
+    """
+    random.seed(seed)
+    state = GameState(width, height)
+    ai = AIController(difficulty)
+    clock = VirtualClock()
+    powerups = PowerUpManager(clock)
+    recorded = []
+
+    for i in range(frames):
+        clock.set(i * FRAME_TIME)
+        if not state.running:
+            state.reset()
+
+        # Player 1 tracks the ball
+        paddle_center = state.paddle1_y + PADDLE_HEIGHT // 2
+        if paddle_center < state.ball_y - 1:
+            move_paddle(state, 1, 'S')
+        elif paddle_center > state.ball_y + 1:
+            move_paddle(state, 1, 'W')
+
+        ai_move = ai.update(state)
+        if ai_move:
+            move_paddle(state, 2, ai_move)
+
+        events = update_physics(state, return_events=True)
+        powerups.update(state, ball_path=events.ball_path)
+
+        recorded.append(RecordedFrame(
+            GameState.from_snapshot(state.snapshot()), events,
+            copy.deepcopy(powerups.get_field_powerups()),
+            copy.deepcopy(powerups.get_active_effects()),
+        ))
+
+    return recorded
+
+
+def record_lobby(frames, seed=0):
+    """Script lobby frames: chat messages arriving and input being typed."""
+    random.seed(seed)
+    lobby = LobbyState()
+    lobby.players_connected = [True, True]
+    words = ["gg", "nice shot", "again?", "ready", "one more", "lag?", "brb"]
+    recorded = []
+    typed = ""
+    for i in range(frames):
+        if i % 25 == 0:
+            lobby.add_message(random.choice([1, 2]), random.choice(words))
+        typed = "" if len(typed) >= 30 else typed + random.choice("abcdef ")
+        recorded.append((copy.deepcopy(lobby), typed))
+    return recorded
+
+
+class AllocationProbe:
+    """Measures memory allocated while rendering each frame (tracemalloc)."""
+
+    def __init__(self):
+        self.peaks = []
+        self._before = 0
+
+    def start(self):
+        self._before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def stop(self):
+        self.peaks.append(tracemalloc.get_traced_memory()[1] - self._before)
+
+
+def _replay_game(render):
+    """Build a replay function for a game renderer."""
+    def replay(frames, probe=None):
+        # Effects run on a virtual frame clock, so every pass animates
+        # identically however fast it renders
+        clock = VirtualClock()
+        effects = EffectsManager(use_unicode=True, clock=clock)
+        for i, frame in enumerate(frames):
+            clock.set(i * FRAME_TIME)
+            process_physics_events(frame.events, effects)
+            if probe:
+                probe.start()
+            render(frame, effects, clock.now())
+            if probe:
+                probe.stop()
+    return replay
+
+
+def _replay_lobby(frames, probe=None):
+    for lobby, typed in frames:
+        if probe:
+            probe.start()
+        renderer.render_lobby(lobby, 1, typed)
+        if probe:
+            probe.stop()
+
+
+# name -> (frame source, replay function)
+RENDERERS = {
+    'game': ('match', _replay_game(
+        lambda f, e, now: renderer.render_game(f.state, 1))),
+    'game_ai': ('match', _replay_game(
+        lambda f, e, now: renderer.render_game_ai(f.state))),
+    'game_effects': ('match', _replay_game(
+        lambda f, e, now: renderer.render_game_with_effects(f.state, 1, e, f, now))),
+    'lobby': ('lobby', _replay_lobby),
+}
+
+
+def measure(name, frames, sink):
+    """
+    Benchmark one renderer.
+
+    Returns:
+        Dict with fps, bytes_per_frame and peak_alloc_kib_per_frame (mean
+        peak of memory allocated while rendering a frame, in KiB, from
+        tracemalloc; a size, not a number of allocations)
+    """
+    _, replay = RENDERERS[name]
+    previous = output.set_sink(sink)
+    try:
+        # Timed pass
+        invalidate_screen()
+        sink.reset_stats()
+        start = time.perf_counter()
+        replay(frames)
+        elapsed = time.perf_counter() - start
+        total_bytes = sink.bytes_written
+
+        # Allocation pass (tracemalloc slows rendering, so it is separate)
+        invalidate_screen()
+        probe = AllocationProbe()
+        tracemalloc.start()
+        try:
+            replay(frames, probe)
+        finally:
+            tracemalloc.stop()
+    finally:
+        output.set_sink(previous)
+        invalidate_screen()
+
+    count = len(frames)
+    return {
+        'renderer': name,
+        'frames': count,
+        'fps': count / elapsed if elapsed > 0 else float('inf'),
+        'bytes_per_frame': total_bytes / count,
+        'peak_alloc_kib_per_frame': sum(probe.peaks) / count / 1024,
+    }
+
+
+def make_sink(kind):
+    """Create a sink by name."""
+    if kind == 'buffer':
+        return output.BufferSink()
+    if kind == 'tty':
+        return output.TTYSink()
+    return output.NullSink()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Terminal Pong renderers")
+    parser.add_argument('--frames', type=int, default=1000, help="frames per renderer")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for scripted sequences")
+    parser.add_argument('--sink', choices=['null', 'buffer', 'tty'], default='null')
+    parser.add_argument('--renderer', nargs='+', choices=sorted(RENDERERS), default=list(RENDERERS))
+    parser.add_argument('--field', default=f"{GAME_WIDTH}x{GAME_HEIGHT}",
+                        help="field size as WIDTHxHEIGHT (e.g. 300x100)")
+    parser.add_argument('--no-color', action='store_true', help="render without ANSI colors")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args()
+
+    # Output is not a TTY here, so pick the color mode explicitly
+    if args.no_color:
+        disable_colors()
+    else:
+        enable_colors()
+
+    width, height = (int(n) for n in args.field.lower().split('x'))
+    sources = {
+        'match': record_match(args.frames, args.seed, width=width, height=height),
+        'lobby': record_lobby(args.frames, args.seed),
+    }
+
+    results = []
+    for name in args.renderer:
+        source, _ = RENDERERS[name]
+        sink = make_sink(args.sink)
+        try:
+            results.append(measure(name, sources[source], sink))
+        finally:
+            sink.close()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'renderer':<14}{'frames':>8}{'fps':>12}{'bytes/frame':>14}{'peak KiB/frame':>18}")
+    for r in results:
+        print(f"{r['renderer']:<14}{r['frames']:>8}{r['fps']:>12.1f}"
+              f"{r['bytes_per_frame']:>14.1f}{r['peak_alloc_kib_per_frame']:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,20 @@ TCP Client for connecting to game server with logging and error handling.
 
 import socket
 import threading
-import time
 import logging
 
-from config import PORT, BUFFER_SIZE, FRAME_TIME, LOG_LEVEL, LOG_FORMAT
-from game_state import GameState, LobbyState
+from config import (
+    PORT, BUFFER_SIZE, FRAME_TIME, TICK_TIME, LOG_LEVEL, LOG_FORMAT,
+    ENABLE_BINARY_PROTOCOL
+)
+from game_state import GameState, LobbyState, interpolate_state
 from input_handler import InputHandler
 from renderer import render_lobby, render_game, show_game_over
+from clock import get_clock
+from protocol import (
+    PROTOCOL_VERSION, PROTOCOL_DELTA, SnapshotDecoder, hello_message, parse_hello,
+    state_from_fields, read_messages
+)
 
 # Configure logging
 logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
@@ -21,10 +28,16 @@ logger = logging.getLogger(__name__)
 class GameClient:
     """TCP Client for connecting to game server."""
     
-    def __init__(self):
+    def __init__(self, clock=None):
+        self.clock = clock or get_clock()
         self.socket = None
         self.player_id = None
         self.game_state = GameState()
+        self.previous_state = self.game_state   # State before the last update
+        self.state_time = 0.0                   # When game_state arrived
+        self.state_tick = None                  # Server tick of game_state (binary only)
+        self.protocol = 0                       # Negotiated version (0 = text)
+        self.decoder = SnapshotDecoder()
         self.lobby_state = LobbyState()
         self.running = True
         self.in_lobby = False
@@ -58,6 +71,8 @@ class GameClient:
                 self.player_id = int(data.split(',')[1])
                 logger.info(f"Connected as Player {self.player_id}")
                 self.connected = True
+                if ENABLE_BINARY_PROTOCOL:
+                    self.send_message(hello_message(PROTOCOL_VERSION))
                 return True
             else:
                 logger.error(f"Unexpected server response: {data}")
@@ -78,12 +93,12 @@ class GameClient:
     
     def receive_updates(self):
         """Receive updates from server in background thread."""
-        buffer = ""
+        buffer = bytearray()
         while self.running and self.connected:
             try:
                 self.socket.settimeout(0.5)
                 try:
-                    data = self.socket.recv(BUFFER_SIZE).decode()
+                    data = self.socket.recv(BUFFER_SIZE)
                 except socket.timeout:
                     continue
                     
@@ -93,9 +108,10 @@ class GameClient:
                     break
                 
                 buffer += data
-                while "\n" in buffer:
-                    message, buffer = buffer.split("\n", 1)
-                    if message:
+                for message in read_messages(buffer):
+                    if isinstance(message, bytes):
+                        self.process_frame(message)
+                    else:
                         self.process_message(message)
                     
             except ConnectionResetError:
@@ -113,7 +129,11 @@ class GameClient:
         """Process a message from server."""
         logger.debug(f"Received: {message[:50]}...")
         
-        if message == "LOBBY_READY":
+        if message.startswith("HELLO,"):
+            self.protocol = parse_hello(message)
+            logger.info(f"Using protocol version {self.protocol}")
+        
+        elif message == "LOBBY_READY":
             with self.lock:
                 self.in_lobby = True
                 self.in_game = False
@@ -136,13 +156,13 @@ class GameClient:
                 self.in_lobby = False
                 self.in_game = True
                 self.game_state.reset()
+                self.previous_state = self.game_state
                 logger.info("Game started")
                 
         elif message.startswith("STATE,"):
             new_state = GameState.deserialize(message)
             if new_state:
-                with self.lock:
-                    self.game_state = new_state
+                self.set_game_state(new_state)
                     
         elif message.startswith("GAMEOVER,"):
             winner = int(message.split(',')[1])
@@ -158,6 +178,25 @@ class GameClient:
                 self.in_game = False
                 logger.info("Returned to lobby")
     
+    def process_frame(self, frame):
+        """Process a binary frame from server."""
+        decoded = self.decoder.decode(frame)
+        if decoded is None:
+            # Delta against a snapshot we don't have; wait for a keyframe
+            return
+        fields, tick = decoded
+        self.set_game_state(state_from_fields(fields), tick)
+        if self.protocol >= PROTOCOL_DELTA:
+            self.send_message(f"ACK,{tick}")
+    
+    def set_game_state(self, new_state, tick=None):
+        """Install a state received from the server."""
+        with self.lock:
+            self.previous_state = self.game_state
+            self.game_state = new_state
+            self.state_tick = tick
+            self.state_time = self.clock.now()
+    
     def send_message(self, message):
         """Send message to server with error handling."""
         if not self.connected:
@@ -191,7 +230,7 @@ class GameClient:
                 elif in_game:
                     self.run_game()
                 else:
-                    time.sleep(0.1)
+                    self.clock.sleep(0.1)
                     
         except KeyboardInterrupt:
             logger.info("Interrupted by user")
@@ -232,32 +271,27 @@ class GameClient:
                 self.send_message("START_GAME")
             
             # Render at fixed rate
-            now = time.time()
+            now = self.clock.now()
             if now - last_render >= 0.1:
                 partial = self.input_handler.get_partial_line()
                 render_lobby(lobby_copy, self.player_id, partial)
                 last_render = now
             
-            time.sleep(0.05)
+            self.clock.sleep(0.05)
     
     def run_game(self):
-        """Run game loop."""
+        """Run game loop, rendering between the last two server states."""
         self.input_handler.set_mode("key")
         last_render = 0
+        state_copy = GameState()
         
         while self.running and self.connected:
             with self.lock:
                 if not self.in_game:
                     break
-                state_copy = GameState()
-                state_copy.ball_x = self.game_state.ball_x
-                state_copy.ball_y = self.game_state.ball_y
-                state_copy.paddle1_y = self.game_state.paddle1_y
-                state_copy.paddle2_y = self.game_state.paddle2_y
-                state_copy.score1 = self.game_state.score1
-                state_copy.score2 = self.game_state.score2
-                state_copy.running = self.game_state.running
-                state_copy.winner = self.game_state.winner
+                # Server states arrive once per tick; blend towards the newest
+                alpha = min(1.0, (self.clock.now() - self.state_time) / TICK_TIME)
+                interpolate_state(self.previous_state, self.game_state, alpha, state_copy)
             
             key = self.input_handler.get_key()
             if key == 'Q':
@@ -266,7 +300,7 @@ class GameClient:
             elif key in ['W', 'S']:
                 self.send_message(f"INPUT,{key}")
             
-            now = time.time()
+            now = self.clock.now()
             if now - last_render >= FRAME_TIME:
                 if state_copy.running:
                     render_game(state_copy, self.player_id)
@@ -274,7 +308,7 @@ class GameClient:
                     show_game_over(state_copy.winner, self.player_id)
                 last_render = now
             
-            time.sleep(0.01)
+            self.clock.sleep(0.01)
     
     def close(self):
         """Close connection gracefully."""
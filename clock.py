@@ -0,0 +1,71 @@
+"""
+Clock Module
+Time source shared by the game loops, physics timers, power-ups and
+effects, so whole matches can run on virtual time.
+"""
+
+import time
+
+
+class RealClock:
+    """Wall-clock time (monotonic, so system clock changes don't jump timers)."""
+
+    def now(self):
+        """Current time in seconds."""
+        return time.monotonic()
+
+    def sleep(self, seconds):
+        """Wait for the given number of seconds."""
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class VirtualClock:
+    """
+    Manually advanced clock for simulations, benchmarks and tests.
+
+    Time only moves when advance() (or sleep()) is called, so a loop
+    driven by it runs as fast as the CPU allows and is reproducible.
+    """
+
+    def __init__(self, start=0.0):
+        self.time = start
+
+    def now(self):
+        """Current virtual time in seconds."""
+        return self.time
+
+    def sleep(self, seconds):
+        """Advance the clock instead of waiting."""
+        self.advance(seconds)
+
+    def advance(self, seconds):
+        """Move time forward by seconds (never backwards)."""
+        if seconds > 0:
+            self.time += seconds
+
+    def set(self, seconds):
+        """Jump to an absolute time."""
+        self.time = seconds
+
+
+# Clock used when none is passed explicitly
+_clock = RealClock()
+
+
+def get_clock():
+    """Get the default clock."""
+    return _clock
+
+
+def set_clock(clock):
+    """
+    Replace the default clock.
+
+    Returns:
+        The previous clock, so callers can restore it
+    """
+    global _clock
+    previous = _clock
+    _clock = clock
+    return previous
@@ -91,6 +91,94 @@ def colorize(text, *styles):
     return f"{style_str}{text}{Style.RESET}"
 
 
+# Codes that change how a blank cell looks (others only affect glyphs)
+_BLANK_VISIBLE_CODES = {
+    Style.UNDERLINE, Style.REVERSE,
+    Style.BG_BLACK, Style.BG_RED, Style.BG_GREEN, Style.BG_YELLOW,
+    Style.BG_BLUE, Style.BG_MAGENTA, Style.BG_CYAN, Style.BG_WHITE,
+}
+
+
+class SgrEncoder:
+    """
+    Tracks the current terminal style and emits SGR codes only on change.
+    
+    Styles are tuples of Style codes, e.g. (Style.BOLD, Style.RED);
+    () is the default style. Adjacent cells with the same style share one
+    escape prefix, and a style that only adds codes to the current one
+    emits just the added codes instead of a reset.
+    """
+    
+    def __init__(self):
+        self.style = ()
+        self._blank_visible = {}
+    
+    def _is_blank_visible(self, style):
+        """Check if a style changes how a blank cell looks (cached)."""
+        visible = self._blank_visible.get(style)
+        if visible is None:
+            visible = any(code in _BLANK_VISIBLE_CODES for code in style)
+            self._blank_visible[style] = visible
+        return visible
+    
+    def transition(self, style):
+        """Get the codes that switch the terminal from the current style to style."""
+        current = self.style
+        if style == current or not COLORS_ENABLED:
+            return ""
+        self.style = style
+        n = len(current)
+        if current == style[:n]:
+            return "".join(style[n:])
+        return Style.RESET + "".join(style)
+    
+    def reset(self):
+        """Get the codes that return the terminal to the default style."""
+        if not self.style:
+            return ""
+        self.style = ()
+        return Style.RESET if COLORS_ENABLED else ""
+    
+    def encode(self, glyphs, styles):
+        """
+        Encode a run of cells, coalescing equal styles.
+        
+        Args:
+            glyphs: Sequence of single-cell strings
+            styles: Sequence of style tuples, same length as glyphs
+            
+        Returns:
+            Encoded string (the encoder keeps the final style)
+        """
+        if not COLORS_ENABLED:
+            return "".join(glyphs)
+        
+        parts = []
+        current = self.style
+        for glyph, style in zip(glyphs, styles):
+            if style != current:
+                # Blanks look the same under styles that only affect glyphs
+                if (glyph == ' ' and not style
+                        and not self._is_blank_visible(current)):
+                    parts.append(glyph)
+                    continue
+                parts.append(self.transition(style))
+                current = style
+            parts.append(glyph)
+        return "".join(parts)
+
+
+def encode_cells(glyphs, styles):
+    """
+    Encode a row of cells, starting and ending in the default style.
+    
+    Usage:
+        encode_cells(['█', ' '], [(Style.BOLD,), ()])
+    """
+    encoder = SgrEncoder()
+    return encoder.encode(glyphs, styles) + encoder.reset()
+
+
 def disable_colors():
     """Disable color output globally."""
     global COLORS_ENABLED
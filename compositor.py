@@ -0,0 +1,498 @@
+"""
+Compositor Module
+Layered frame compositor for the game field with reusable preallocated buffers.
+"""
+
+from config import (
+    GAME_WIDTH, GAME_HEIGHT, PADDLE_HEIGHT,
+    BALL_CHAR, PADDLE_CHAR, NET_CHAR, ENABLE_UNICODE,
+    ENABLE_NUMPY, NUMPY_MIN_FIELD_AREA, ENABLE_HALF_BLOCKS
+)
+import colors
+from colors import Style, encode_cells
+from particles import ParticlePool, KIND_TRAIL, KIND_NAMES
+
+# NumPy is optional; the array-backed compositor is used when it is installed
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# Layers from back to front. A cell only takes a glyph from a layer that is
+# at least as high as the one already drawn there this frame.
+LAYER_BACKGROUND = 0   # Blanks and the center net
+LAYER_POWERUP = 1      # Drawn under the net, like the original renderer
+LAYER_PADDLE = 2
+LAYER_BALL = 3
+LAYER_TRAIL = 4        # Ball trail, under the other effects
+LAYER_PARTICLE = 5
+
+# Styles per element (tuples of Style codes, () = default)
+STYLE_NONE = ()
+STYLE_NET = (Style.DIM,)
+STYLE_PADDLE_LEFT = (Style.BOLD,)
+STYLE_PADDLE_RIGHT = (Style.DIM,)
+STYLE_BALL = (Style.BOLD,)
+STYLE_BALL_WARNING = (Style.BOLD, Style.RED)
+STYLE_POWERUP = (Style.BOLD, Style.YELLOW)
+
+PARTICLE_STYLES = {
+    'explosion': (Style.BOLD, Style.YELLOW),
+    'trail': (Style.DIM,),
+    'hit': (Style.CYAN,),
+}
+
+# Particle styles indexed by ParticlePool kind
+PARTICLE_KIND_STYLES = tuple(PARTICLE_STYLES[name] for name in KIND_NAMES)
+
+# Half-block glyphs for sub-cell vertical positions
+UPPER_HALF = "▀"
+LOWER_HALF = "▄"
+FULL_BLOCK = "█"
+
+# Ball within this many columns of a goal line is drawn as a warning
+GOAL_WARNING_DISTANCE = 8
+
+# Encoded rows kept in the row memo before it is cleared
+ROW_CACHE_SIZE = 4096
+
+
+class FieldCompositor:
+    """
+    Composes the game field from layers into reusable row buffers.
+
+    The background (blanks and net) is computed once. Each frame only the
+    cells touched by the previous frame are restored, then power-ups,
+    paddles, ball and particles are stamped in layer order, and a single
+    encode pass turns the grid into row strings.
+
+    Encoded rows are memoized by their contents (background kind plus the
+    occupied cells with glyph and style), so rows holding only the net, or
+    the same paddle segment as before, cost a dictionary lookup.
+
+    In half-block mode (Unicode only) each cell is split into an upper and
+    lower half, so the ball and paddle ends move in half-cell steps.
+    """
+
+    def __init__(self, width=GAME_WIDTH, height=GAME_HEIGHT, use_unicode=ENABLE_UNICODE,
+                 half_blocks=ENABLE_HALF_BLOCKS):
+        self.width = width
+        self.height = height
+        self.half_blocks = half_blocks and use_unicode
+        self.paddle_char = PADDLE_CHAR if use_unicode else '|'
+        self.ball_char = BALL_CHAR if use_unicode else 'O'
+        self.paddle1_x = 2
+        self.paddle2_x = width - 3
+
+        # Background layer: blanks plus the dashed center net
+        center_x = width // 2
+        self._base_glyphs = []
+        self._base_styles = []
+        self._base_keys = []     # Rows with equal backgrounds share a key
+        for y in range(height):
+            glyphs = [' '] * width
+            styles = [STYLE_NONE] * width
+            if y % 2 == 0:
+                glyphs[center_x] = NET_CHAR
+                styles[center_x] = STYLE_NET
+            self._base_glyphs.append(glyphs)
+            self._base_styles.append(styles)
+            self._base_keys.append(y % 2)
+
+        # Composed frame (preallocated, restored incrementally)
+        self.glyphs = [row[:] for row in self._base_glyphs]
+        self.styles = [row[:] for row in self._base_styles]
+        self.layers = [[LAYER_BACKGROUND] * width for _ in range(height)]
+        self.rows = [''] * height
+        self._touched = [[] for _ in range(height)]   # Touched columns per row
+        self._row_cache = {}
+        self._row_cache_colors = colors.COLORS_ENABLED
+
+    def _clear(self):
+        """Restore cells touched by the previous frame to the background."""
+        glyphs = self.glyphs
+        styles = self.styles
+        layers = self.layers
+        base_glyphs = self._base_glyphs
+        base_styles = self._base_styles
+        for y, columns in enumerate(self._touched):
+            if not columns:
+                continue
+            for x in columns:
+                glyphs[y][x] = base_glyphs[y][x]
+                styles[y][x] = base_styles[y][x]
+                layers[y][x] = LAYER_BACKGROUND
+            columns.clear()
+
+    def _stamp(self, x, y, glyph, style, layer):
+        """Draw a glyph on a layer if nothing higher is already there."""
+        if layer < self.layers[y][x]:
+            return
+        self.glyphs[y][x] = glyph
+        self.styles[y][x] = style
+        self.layers[y][x] = layer
+        self._touched[y].append(x)
+
+    def _paddle_cells(self, top, height):
+        """
+        Get the (y, glyph) cells covered by a paddle.
+
+        In half-block mode top is rounded to the nearest half cell and
+        partly covered end cells get a half block.
+        """
+        if not self.half_blocks:
+            top = int(top)
+            return [(y, self.paddle_char)
+                    for y in range(max(0, top), min(self.height, top + height))]
+
+        sub_top = int(round(top * 2))
+        sub_bottom = sub_top + height * 2
+        cells = []
+        for y in range(max(0, sub_top // 2), min(self.height, (sub_bottom + 1) // 2)):
+            upper = sub_top <= 2 * y < sub_bottom
+            lower = sub_top <= 2 * y + 1 < sub_bottom
+            if upper and lower:
+                cells.append((y, FULL_BLOCK))
+            else:
+                cells.append((y, UPPER_HALF if upper else LOWER_HALF))
+        return cells
+
+    def _ball_cell(self, state):
+        """Get the ball's (x, y, glyph), or None when it is off the field."""
+        ball_x = int(state.ball_x)
+        if self.half_blocks:
+            sub_y = int(state.ball_y * 2)
+            ball_y = sub_y // 2
+            glyph = LOWER_HALF if sub_y % 2 else UPPER_HALF
+        else:
+            ball_y = int(state.ball_y)
+            glyph = self.ball_char
+        if 0 <= ball_x < self.width and 0 <= ball_y < self.height:
+            return ball_x, ball_y, glyph
+        return None
+
+    def _stamp_paddle(self, x, top, height, style):
+        """Draw a paddle column."""
+        for y, glyph in self._paddle_cells(top, height):
+            self._stamp(x, y, glyph, style, LAYER_PADDLE)
+
+    def compose(self, state, powerups=None, particles=None):
+        """
+        Compose the field for a game state.
+
+        Args:
+            state: GameState object
+            powerups: Optional iterable of PowerUp objects on the field
+            particles: Optional iterable of (x, y, char, effect_type) tuples
+
+        Returns:
+            List of encoded row strings (reused between calls)
+        """
+        self._clear()
+        width = self.width
+        height = self.height
+
+        # Power-ups (hidden under the net)
+        if powerups:
+            for powerup in powerups:
+                px, py = int(powerup.x), int(powerup.y)
+                if 0 <= px < width and 0 <= py < height and self._base_glyphs[py][px] == ' ':
+                    self._stamp(px, py, powerup.symbol, STYLE_POWERUP, LAYER_POWERUP)
+
+        # Paddles (support dynamic heights from power-ups)
+        paddle1_height = getattr(state, 'paddle1_height', PADDLE_HEIGHT)
+        paddle2_height = getattr(state, 'paddle2_height', PADDLE_HEIGHT)
+        self._stamp_paddle(self.paddle1_x, state.paddle1_y, paddle1_height, STYLE_PADDLE_LEFT)
+        self._stamp_paddle(self.paddle2_x, state.paddle2_y, paddle2_height, STYLE_PADDLE_RIGHT)
+
+        # Ball, with warning style near a goal
+        ball = self._ball_cell(state)
+        if ball:
+            ball_x, ball_y, glyph = ball
+            near_goal = ball_x < GOAL_WARNING_DISTANCE or ball_x > width - GOAL_WARNING_DISTANCE
+            style = STYLE_BALL_WARNING if near_goal else STYLE_BALL
+            self._stamp(ball_x, ball_y, glyph, style, LAYER_BALL)
+
+        # Effect particles (drawn over everything)
+        if particles:
+            self._stamp_particles(particles)
+
+        return self._encode()
+
+    def _stamp_particles(self, particles):
+        """Draw effect particles from a ParticlePool or (x, y, char, effect_type) tuples."""
+        width = self.width
+        height = self.height
+        if isinstance(particles, ParticlePool):
+            # Read the pool's arrays directly
+            xs, ys, kinds = particles.x, particles.y, particles.kind
+            glyph_ids, glyphs = particles.glyph, particles.glyphs
+            colored = particles.colored
+            for i in range(particles.count):
+                x = xs[i]
+                y = ys[i]
+                if 0 <= x < width and 0 <= y < height:
+                    kind = kinds[i]
+                    style = PARTICLE_KIND_STYLES[kind] if colored else STYLE_NONE
+                    layer = LAYER_TRAIL if kind == KIND_TRAIL else LAYER_PARTICLE
+                    self._stamp(int(x), int(y), glyphs[glyph_ids[i]], style, layer)
+            return
+
+        for x, y, char, effect_type in particles:
+            if 0 <= x < width and 0 <= y < height:
+                style = PARTICLE_STYLES.get(effect_type, STYLE_NONE)
+                layer = LAYER_TRAIL if effect_type == 'trail' else LAYER_PARTICLE
+                self._stamp(int(x), int(y), char, style, layer)
+
+    def _encode(self):
+        """Encode the composed grid into row strings (memoized per row contents)."""
+        cache = self._row_cache
+        if self._row_cache_colors != colors.COLORS_ENABLED or len(cache) > ROW_CACHE_SIZE:
+            cache.clear()
+            self._row_cache_colors = colors.COLORS_ENABLED
+
+        rows = self.rows
+        glyphs = self.glyphs
+        styles = self.styles
+        for y in range(self.height):
+            columns = self._touched[y]
+            if columns:
+                row_glyphs = glyphs[y]
+                row_styles = styles[y]
+                key = (self._base_keys[y],) + tuple(
+                    (x, row_glyphs[x], row_styles[x]) for x in sorted(set(columns))
+                )
+            else:
+                key = self._base_keys[y]
+            row = cache.get(key)
+            if row is None:
+                row = encode_cells(glyphs[y], styles[y])
+                cache[key] = row
+            rows[y] = row
+        return rows
+
+
+class NumpyFieldCompositor(FieldCompositor):
+    """
+    FieldCompositor backed by NumPy arrays of glyph and style codes.
+
+    Glyphs and styles are interned into small integer codes. Each frame
+    the preallocated frame arrays are reset from the background arrays in
+    one copy, particles are scattered in one vectorized assignment, and
+    only rows whose codes differ from the previous frame are re-encoded
+    (through the same row memo as the list-based compositor).
+    """
+
+    def __init__(self, width=GAME_WIDTH, height=GAME_HEIGHT, use_unicode=ENABLE_UNICODE,
+                 half_blocks=ENABLE_HALF_BLOCKS):
+        super().__init__(width, height, use_unicode, half_blocks)
+
+        # Code tables (index -> glyph / style) and their reverse lookups
+        self._glyph_table = []
+        self._glyph_codes = {}
+        self._style_table = []
+        self._style_codes = {}
+
+        self._base_glyph_codes = np.empty((height, width), dtype=np.int16)
+        self._base_style_codes = np.empty((height, width), dtype=np.int16)
+        for y in range(height):
+            self._base_glyph_codes[y] = [self._glyph_code(g) for g in self._base_glyphs[y]]
+            self._base_style_codes[y] = [self._style_code(s) for s in self._base_styles[y]]
+
+        self.glyph_codes = self._base_glyph_codes.copy()
+        self.style_codes = self._base_style_codes.copy()
+        self._prev_glyph_codes = np.full((height, width), -1, dtype=np.int16)
+        self._prev_style_codes = np.full((height, width), -1, dtype=np.int16)
+        self._blank_code = self._glyph_code(' ')
+        self._particle_style_codes = {
+            effect_type: self._style_code(style)
+            for effect_type, style in PARTICLE_STYLES.items()
+        }
+        self._none_style_code = self._style_code(STYLE_NONE)
+        self._kind_style_codes = np.array(
+            [self._style_code(style) for style in PARTICLE_KIND_STYLES], dtype=np.int16)
+        # Pool glyph index -> glyph code, for the pool last drawn
+        self._pool = None
+        self._pool_glyph_codes = np.empty(0, dtype=np.int16)
+
+    def _glyph_code(self, glyph):
+        """Intern a glyph and return its code."""
+        code = self._glyph_codes.get(glyph)
+        if code is None:
+            code = len(self._glyph_table)
+            self._glyph_table.append(glyph)
+            self._glyph_codes[glyph] = code
+        return code
+
+    def _style_code(self, style):
+        """Intern a style tuple and return its code."""
+        code = self._style_codes.get(style)
+        if code is None:
+            code = len(self._style_table)
+            self._style_table.append(style)
+            self._style_codes[style] = code
+        return code
+
+    def compose(self, state, powerups=None, particles=None):
+        """
+        Compose the field for a game state.
+
+        Args:
+            state: GameState object
+            powerups: Optional iterable of PowerUp objects on the field
+            particles: Optional iterable of (x, y, char, effect_type) tuples
+
+        Returns:
+            List of encoded row strings (reused between calls)
+        """
+        width = self.width
+        height = self.height
+        glyph_codes = self.glyph_codes
+        style_codes = self.style_codes
+
+        # Background layer in one copy
+        np.copyto(glyph_codes, self._base_glyph_codes)
+        np.copyto(style_codes, self._base_style_codes)
+
+        # Power-ups (hidden under the net)
+        if powerups:
+            for powerup in powerups:
+                px, py = int(powerup.x), int(powerup.y)
+                if (0 <= px < width and 0 <= py < height
+                        and self._base_glyph_codes[py, px] == self._blank_code):
+                    glyph_codes[py, px] = self._glyph_code(powerup.symbol)
+                    style_codes[py, px] = self._style_code(STYLE_POWERUP)
+
+        # Paddles
+        paddle1_height = getattr(state, 'paddle1_height', PADDLE_HEIGHT)
+        paddle2_height = getattr(state, 'paddle2_height', PADDLE_HEIGHT)
+        self._stamp_paddle_array(self.paddle1_x, state.paddle1_y, paddle1_height, STYLE_PADDLE_LEFT)
+        self._stamp_paddle_array(self.paddle2_x, state.paddle2_y, paddle2_height, STYLE_PADDLE_RIGHT)
+
+        # Ball
+        ball = self._ball_cell(state)
+        if ball:
+            ball_x, ball_y, glyph = ball
+            near_goal = ball_x < GOAL_WARNING_DISTANCE or ball_x > width - GOAL_WARNING_DISTANCE
+            glyph_codes[ball_y, ball_x] = self._glyph_code(glyph)
+            style_codes[ball_y, ball_x] = self._style_code(
+                STYLE_BALL_WARNING if near_goal else STYLE_BALL)
+
+        # Particles in one scatter (drawn over everything)
+        if particles:
+            self._scatter_particles(particles)
+
+        return self._encode_arrays()
+
+    def _stamp_paddle_array(self, x, top, height, style):
+        """Draw a paddle column with a slice assignment."""
+        if self.half_blocks:
+            style_code = self._style_code(style)
+            for y, glyph in self._paddle_cells(top, height):
+                self.glyph_codes[y, x] = self._glyph_code(glyph)
+                self.style_codes[y, x] = style_code
+            return
+        top = int(top)
+        start = max(0, top)
+        end = min(self.height, top + height)
+        if start < end:
+            self.glyph_codes[start:end, x] = self._glyph_code(self.paddle_char)
+            self.style_codes[start:end, x] = self._style_code(style)
+
+    def _scatter_particles(self, particles):
+        """Place all particles with vectorized assignments."""
+        if isinstance(particles, ParticlePool):
+            count = particles.count
+            if not count:
+                return
+            # View the pool's arrays without copying
+            xs = np.frombuffer(particles.x, dtype=np.float64, count=count)
+            ys = np.frombuffer(particles.y, dtype=np.float64, count=count)
+            kinds = np.frombuffer(particles.kind, dtype=np.uint8, count=count)
+            glyph_ids = np.frombuffer(particles.glyph, dtype=np.uint16, count=count)
+            glyphs = self._pool_glyph_map(particles)[glyph_ids]
+            if particles.colored:
+                styles = self._kind_style_codes[kinds]
+            else:
+                styles = np.full(count, self._none_style_code, dtype=np.int16)
+            self._scatter(xs, ys, glyphs, styles, kinds == KIND_TRAIL)
+            return
+
+        count = len(particles)
+        xs = np.empty(count, dtype=np.float64)
+        ys = np.empty(count, dtype=np.float64)
+        glyphs = np.empty(count, dtype=np.int16)
+        styles = np.empty(count, dtype=np.int16)
+        trail = np.empty(count, dtype=bool)
+        style_lookup = self._particle_style_codes
+        none_style = self._none_style_code
+        for i, (x, y, char, effect_type) in enumerate(particles):
+            xs[i] = x
+            ys[i] = y
+            glyphs[i] = self._glyph_code(char)
+            styles[i] = style_lookup.get(effect_type, none_style)
+            trail[i] = effect_type == 'trail'
+        self._scatter(xs, ys, glyphs, styles, trail)
+
+    def _pool_glyph_map(self, pool):
+        """Get an array mapping the pool's glyph indexes to glyph codes."""
+        if pool is not self._pool or len(self._pool_glyph_codes) != len(pool.glyphs):
+            self._pool = pool
+            self._pool_glyph_codes = np.array(
+                [self._glyph_code(char) for char in pool.glyphs], dtype=np.int16)
+        return self._pool_glyph_codes
+
+    def _scatter(self, xs, ys, glyphs, styles, trail):
+        """Write in-bounds particles, the trail first so other effects cover it."""
+        inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        for mask in (inside & trail, inside & ~trail):
+            cols = xs[mask].astype(np.intp)
+            rows = ys[mask].astype(np.intp)
+            self.glyph_codes[rows, cols] = glyphs[mask]
+            self.style_codes[rows, cols] = styles[mask]
+
+    def _encode_arrays(self):
+        """Encode rows whose codes changed since the previous frame."""
+        cache = self._row_cache
+        if self._row_cache_colors != colors.COLORS_ENABLED or len(cache) > ROW_CACHE_SIZE:
+            cache.clear()
+            self._row_cache_colors = colors.COLORS_ENABLED
+            self._prev_glyph_codes.fill(-1)
+
+        changed = np.flatnonzero(
+            (self.glyph_codes != self._prev_glyph_codes).any(axis=1)
+            | (self.style_codes != self._prev_style_codes).any(axis=1)
+        )
+
+        rows = self.rows
+        glyph_table = self._glyph_table
+        style_table = self._style_table
+        for y in changed.tolist():
+            glyph_row = self.glyph_codes[y]
+            style_row = self.style_codes[y]
+            key = glyph_row.tobytes() + style_row.tobytes()
+            row = cache.get(key)
+            if row is None:
+                row = encode_cells([glyph_table[c] for c in glyph_row.tolist()],
+                                   [style_table[c] for c in style_row.tolist()])
+                cache[key] = row
+            rows[y] = row
+
+        np.copyto(self._prev_glyph_codes, self.glyph_codes)
+        np.copyto(self._prev_style_codes, self.style_codes)
+        return rows
+
+
+def create_compositor(width=GAME_WIDTH, height=GAME_HEIGHT, use_unicode=ENABLE_UNICODE,
+                      half_blocks=ENABLE_HALF_BLOCKS):
+    """
+    Create the best compositor for a field size.
+
+    The NumPy compositor is used when NumPy is installed, enabled in
+    config, and the field is large enough for array work to pay off.
+    """
+    if ENABLE_NUMPY and NUMPY_AVAILABLE and width * height >= NUMPY_MIN_FIELD_AREA:
+        return NumpyFieldCompositor(width, height, use_unicode, half_blocks)
+    return FieldCompositor(width, height, use_unicode, half_blocks)
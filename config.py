@@ -10,14 +10,27 @@ PADDLE_HEIGHT = 4
 # Scoring
 WIN_SCORE = 5
 
-# Frame rate
+# Frame rate (rendering)
 FPS = 20
 FRAME_TIME = 1.0 / FPS
 
+# Simulation rate (fixed timestep). Ball and paddle speeds are per tick,
+# so this also sets the game speed; rendering interpolates between ticks.
+TICK_RATE = 20
+TICK_TIME = 1.0 / TICK_RATE
+MAX_TICKS_PER_FRAME = 5
+
 # Network
 PORT = 5555
 BUFFER_SIZE = 2048
 
+# Offer/accept binary game snapshots (see protocol.py); peers that don't
+# negotiate keep the text STATE messages
+ENABLE_BINARY_PROTOCOL = True
+
+# Delta snapshot clients get a full snapshot at least this often (ticks)
+SNAPSHOT_KEYFRAME_INTERVAL = 60
+
 # Ball speed
 BALL_SPEED_X = 1.5
 BALL_SPEED_Y = 1.0
@@ -36,6 +49,18 @@ ENABLE_COLORS = True
 # Enable Unicode box drawing (disable for ASCII-only terminals)
 ENABLE_UNICODE = True
 
+# Use the NumPy field renderer when NumPy is installed and the field has
+# at least this many cells (small fields are faster with plain lists)
+ENABLE_NUMPY = True
+NUMPY_MIN_FIELD_AREA = 4000
+
+# Draw ball and paddles with half-block glyphs (double vertical resolution,
+# needs Unicode; the ball is drawn as a half block instead of BALL_CHAR)
+ENABLE_HALF_BLOCKS = False
+
+# Maximum number of live effect particles (further spawns are dropped)
+PARTICLE_POOL_CAPACITY = 1024
+
 # ============================================================================
 # LOGGING SETTINGS
 # ============================================================================
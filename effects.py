@@ -1,16 +1,29 @@
 """
 Visual Effects Module
 ASCII animations and visual effects for game events.
+
+Effects do not build particle lists. Each effect spawns the particles of
+its current animation frame into a shared ParticlePool, which ages and
+compacts them in place.
 """
 
-import time
-from collections import deque
+import logging
+from array import array
+
+from config import FRAME_TIME, PARTICLE_POOL_CAPACITY
+from clock import get_clock
+from particles import (
+    ParticlePool, KIND_TRAIL, KIND_EXPLOSION, KIND_HIT, LIFE_EPSILON
+)
+
+logger = logging.getLogger(__name__)
 
 
 class BallTrail:
     """
     Creates a trailing effect behind the ball.
-    Stores recent ball positions and renders them with fading intensity.
+    Stores recent ball positions in a ring buffer and spawns them with
+    fading intensity.
     """
     
     # Trail characters from newest to oldest (fading effect)
@@ -25,39 +38,116 @@ class BallTrail:
             max_length: Number of trail positions to keep
             use_unicode: Whether to use Unicode characters
         """
-        self.positions = deque(maxlen=max_length)
         self.use_unicode = use_unicode
+        self._allocate(max_length)
+    
+    def _allocate(self, max_length):
+        """Create empty ring buffers for max_length positions."""
+        self.max_length = max_length
+        self._xs = array('i', bytes(4 * max_length))
+        self._ys = array('i', bytes(4 * max_length))
+        self._head = 0      # Next slot to write
+        self._count = 0
+    
+    def __len__(self):
+        return self._count
+    
+    def _positions(self):
+        """Yield stored positions, oldest first."""
+        size = self.max_length
+        for k in range(self._count):
+            i = (self._head - self._count + k) % size
+            yield self._xs[i], self._ys[i]
+    
+    def set_max_length(self, max_length):
+        """Change the trail length, keeping the newest positions."""
+        if max_length == self.max_length:
+            return
+        positions = list(self._positions())[-max_length:]
+        self._allocate(max_length)
+        for x, y in positions:
+            self.update(x, y)
     
     def update(self, x, y):
         """Add new ball position to trail."""
-        self.positions.append((int(x), int(y)))
+        self._xs[self._head] = int(x)
+        self._ys[self._head] = int(y)
+        self._head = (self._head + 1) % self.max_length
+        if self._count < self.max_length:
+            self._count += 1
     
-    def get_trail(self):
-        """
-        Get trail positions with their display characters.
-        
-        Returns:
-            List of (x, y, char) tuples, oldest first
-        """
+    def emit(self, pool):
+        """Spawn the trail into the pool for one frame."""
         chars = self.TRAIL_CHARS if self.use_unicode else self.TRAIL_CHARS_ASCII
-        trail = []
-        
-        positions = list(self.positions)
-        # Skip the last position (current ball position)
-        for i, (x, y) in enumerate(positions[:-1] if len(positions) > 1 else []):
-            # Older positions use later characters (more faded)
-            char_idx = len(positions) - i - 2
+        size = self.max_length
+        count = self._count
+        for k in range(count - 1):
+            char_idx = count - k - 2
             if char_idx < len(chars):
-                trail.append((x, y, chars[char_idx]))
-        
-        return trail
+                i = (self._head - count + k) % size
+                pool.spawn(self._xs[i], self._ys[i], chars[char_idx], KIND_TRAIL, 0.0)
     
     def clear(self):
         """Clear the trail."""
-        self.positions.clear()
+        self._head = 0
+        self._count = 0
+
+
+class AnimatedEffect:
+    """
+    Base class for frame-based effects that spawn into a ParticlePool.
+    
+    Each animation frame's particles are spawned with a life of one frame
+    duration, so they expire from the pool exactly when the next frame is
+    spawned.
+    """
+    
+    frame_duration = 0.1  # seconds per frame
+    
+    def __init__(self, pool, frame_step=1):
+        """
+        Args:
+            pool: ParticlePool to spawn into
+            frame_step: Animation frames to advance per step (2 skips
+                every other frame)
+        """
+        self.pool = pool
+        self.frame_step = frame_step
+        self.current_frame = 0
+        self.elapsed = 0.0
+        self.started = False
+        self.finished = False
+    
+    def frame_count(self):
+        """Number of animation frames."""
+        raise NotImplementedError
+    
+    def spawn_frame(self):
+        """Spawn the particles of the current animation frame."""
+        raise NotImplementedError
+    
+    def update(self, dt):
+        """Advance the animation by dt seconds. Call this each render frame."""
+        if self.finished:
+            return
+        
+        if not self.started:
+            # First frame is shown on the first update after the trigger
+            self.started = True
+        else:
+            self.elapsed += dt
+            if self.elapsed < self.frame_duration - LIFE_EPSILON:
+                return
+            self.elapsed = 0.0
+            self.current_frame += self.frame_step
+            if self.current_frame >= self.frame_count():
+                self.finished = True
+                return
+        
+        self.spawn_frame()
 
 
-class GoalExplosion:
+class GoalExplosion(AnimatedEffect):
     """
     Explosion animation when a goal is scored.
     """
@@ -105,55 +195,32 @@ class GoalExplosion:
         [(0, 0, '.')],
     ]
     
-    def __init__(self, x, y, use_unicode=True):
+    def __init__(self, x, y, pool, use_unicode=True, frame_step=1):
         """
         Start an explosion at the given position.
         
         Args:
             x, y: Center position of explosion
+            pool: ParticlePool to spawn into
             use_unicode: Whether to use Unicode characters
+            frame_step: Animation frames to advance per step
         """
+        super().__init__(pool, frame_step)
         self.x = x
         self.y = y
         self.use_unicode = use_unicode
-        self.current_frame = 0
-        self.frame_duration = 0.1  # seconds per frame
-        self.last_frame_time = time.time()
-        self.finished = False
+        self.frames = self.EXPLOSION_FRAMES if use_unicode else self.EXPLOSION_FRAMES_ASCII
     
-    def update(self):
-        """Update explosion animation. Call this each render frame."""
-        if self.finished:
-            return
-        
-        current_time = time.time()
-        if current_time - self.last_frame_time >= self.frame_duration:
-            self.current_frame += 1
-            self.last_frame_time = current_time
-            
-            frames = self.EXPLOSION_FRAMES if self.use_unicode else self.EXPLOSION_FRAMES_ASCII
-            if self.current_frame >= len(frames):
-                self.finished = True
+    def frame_count(self):
+        return len(self.frames)
     
-    def get_particles(self):
-        """
-        Get current explosion particles.
-        
-        Returns:
-            List of (x, y, char) tuples for current frame
-        """
-        if self.finished:
-            return []
-        
-        frames = self.EXPLOSION_FRAMES if self.use_unicode else self.EXPLOSION_FRAMES_ASCII
-        if self.current_frame >= len(frames):
-            return []
-        
-        frame = frames[self.current_frame]
-        return [(self.x + dx, self.y + dy, char) for dx, dy, char in frame]
+    def spawn_frame(self):
+        spawn = self.pool.spawn
+        for dx, dy, char in self.frames[self.current_frame]:
+            spawn(self.x + dx, self.y + dy, char, KIND_EXPLOSION, self.frame_duration)
 
 
-class PaddleHitEffect:
+class PaddleHitEffect(AnimatedEffect):
     """
     Brief flash effect when ball hits paddle.
     """
@@ -161,119 +228,209 @@ class PaddleHitEffect:
     FLASH_CHARS = ['█', '▓', '▒', '░']
     FLASH_CHARS_ASCII = ['#', '=', '-', ' ']
     
-    def __init__(self, paddle_x, paddle_y, paddle_height, use_unicode=True):
+    frame_duration = 0.05
+    
+    def __init__(self, paddle_x, paddle_y, paddle_height, pool, use_unicode=True):
         """
         Create hit effect on paddle.
         """
+        super().__init__(pool)
         self.paddle_x = paddle_x
         self.paddle_y = paddle_y
         self.paddle_height = paddle_height
         self.use_unicode = use_unicode
-        self.current_frame = 0
-        self.frame_duration = 0.05
-        self.last_frame_time = time.time()
-        self.finished = False
+        self.chars = self.FLASH_CHARS if use_unicode else self.FLASH_CHARS_ASCII
     
-    def update(self):
-        """Update hit effect animation."""
-        if self.finished:
-            return
-        
-        current_time = time.time()
-        if current_time - self.last_frame_time >= self.frame_duration:
-            self.current_frame += 1
-            self.last_frame_time = current_time
-            
-            chars = self.FLASH_CHARS if self.use_unicode else self.FLASH_CHARS_ASCII
-            if self.current_frame >= len(chars):
-                self.finished = True
+    def frame_count(self):
+        return len(self.chars)
     
-    def get_particles(self):
-        """Get current effect particles."""
-        if self.finished:
-            return []
+    def spawn_frame(self):
+        # Flash over the paddle
+        char = self.chars[self.current_frame]
+        for i in range(self.paddle_height):
+            self.pool.spawn(self.paddle_x, self.paddle_y + i, char, KIND_HIT, self.frame_duration)
+
+
+class EffectsLOD:
+    """
+    Effects level-of-detail controller driven by a frame-time budget.
+
+    The game loop reports how long each frame took. A run of frames over
+    the budget steps the level down; a longer run of frames well under the
+    budget steps it back up.
+    """
+    
+    # Settings per level, lowest detail first
+    LEVELS = [
+        {'name': 'minimal', 'trail_length': 1, 'explosion_step': 2, 'color': False},
+        {'name': 'low', 'trail_length': 2, 'explosion_step': 2, 'color': False},
+        {'name': 'medium', 'trail_length': 3, 'explosion_step': 1, 'color': True},
+        {'name': 'full', 'trail_length': 5, 'explosion_step': 1, 'color': True},
+    ]
+    
+    def __init__(self, budget=FRAME_TIME, overrun_frames=3, recover_frames=40, headroom=0.6):
+        """
+        Initialize the controller at full detail.
         
-        chars = self.FLASH_CHARS if self.use_unicode else self.FLASH_CHARS_ASCII
-        if self.current_frame >= len(chars):
-            return []
+        Args:
+            budget: Frame time budget in seconds
+            overrun_frames: Consecutive over-budget frames before stepping down
+            recover_frames: Consecutive frames under headroom * budget
+                before stepping up
+            headroom: Fraction of the budget a frame must stay under to
+                count towards stepping up
+        """
+        self.budget = budget
+        self.overrun_frames = overrun_frames
+        self.recover_frames = recover_frames
+        self.headroom = headroom
+        self.level = len(self.LEVELS) - 1
+        self.last_frame_time = 0.0
+        self._overruns = 0
+        self._fast_frames = 0
+    
+    @property
+    def settings(self):
+        """Settings dict for the current level."""
+        return self.LEVELS[self.level]
+    
+    @property
+    def name(self):
+        """Name of the current level."""
+        return self.LEVELS[self.level]['name']
+    
+    def record_frame(self, frame_time):
+        """
+        Record how long a frame took and adjust the level.
         
-        char = chars[self.current_frame]
-        # Flash next to paddle
-        return [(self.paddle_x, self.paddle_y + i, char) 
-                for i in range(self.paddle_height)]
+        Returns:
+            bool: True if the level changed
+        """
+        self.last_frame_time = frame_time
+        if frame_time > self.budget:
+            self._overruns += 1
+            self._fast_frames = 0
+            if self._overruns >= self.overrun_frames and self.level > 0:
+                return self._set_level(self.level - 1)
+        elif frame_time < self.budget * self.headroom:
+            self._fast_frames += 1
+            self._overruns = 0
+            if self._fast_frames >= self.recover_frames and self.level < len(self.LEVELS) - 1:
+                return self._set_level(self.level + 1)
+        else:
+            self._overruns = 0
+            self._fast_frames = 0
+        return False
+    
+    def _set_level(self, level):
+        logger.debug(f"Effects LOD {self.name} -> {self.LEVELS[level]['name']} "
+                     f"(frame {self.last_frame_time * 1000:.1f} ms)")
+        self.level = level
+        self._overruns = 0
+        self._fast_frames = 0
+        return True
 
 
 class EffectsManager:
     """
     Manages all visual effects during gameplay.
+    
+    All effects spawn into one ParticlePool (get_all_particles returns it),
+    so many concurrent effects, e.g. several goals at once, cost no
+    per-frame list building.
     """
     
-    def __init__(self, use_unicode=True):
+    def __init__(self, use_unicode=True, capacity=PARTICLE_POOL_CAPACITY, clock=None):
         """Initialize effects manager."""
         self.use_unicode = use_unicode
+        self.clock = clock or get_clock()
+        self.particles = ParticlePool(capacity)
         self.ball_trail = BallTrail(max_length=5, use_unicode=use_unicode)
         self.active_explosions = []
         self.active_hit_effects = []
+        self._last_update = None
+        self.lod = EffectsLOD()
+        self._apply_lod()
+    
+    @property
+    def lod_level(self):
+        """Current effects level of detail (0 = minimal)."""
+        return self.lod.level
+    
+    def record_frame_time(self, frame_time):
+        """Report a frame's duration so the level of detail can adapt."""
+        if self.lod.record_frame(frame_time):
+            self._apply_lod()
+    
+    def _apply_lod(self):
+        """Apply the current level of detail to the effects."""
+        self.ball_trail.set_max_length(self.lod.settings['trail_length'])
+        self.particles.colored = self.lod.settings['color']
     
     def update_ball_trail(self, ball_x, ball_y):
-        """Update ball trail with new position."""
+        """Update ball trail with new position and spawn it for this frame."""
         self.ball_trail.update(ball_x, ball_y)
+        self.ball_trail.emit(self.particles)
     
     def trigger_goal_explosion(self, x, y):
         """Trigger a goal explosion at given position."""
-        explosion = GoalExplosion(x, y, self.use_unicode)
+        explosion = GoalExplosion(x, y, self.particles, self.use_unicode,
+                                  self.lod.settings['explosion_step'])
         self.active_explosions.append(explosion)
     
     def trigger_paddle_hit(self, paddle_x, paddle_y, paddle_height):
         """Trigger a paddle hit effect."""
-        effect = PaddleHitEffect(paddle_x, paddle_y, paddle_height, self.use_unicode)
+        effect = PaddleHitEffect(paddle_x, paddle_y, paddle_height, self.particles, self.use_unicode)
         self.active_hit_effects.append(effect)
     
-    def update(self):
-        """Update all active effects."""
-        # Update explosions
-        for explosion in self.active_explosions[:]:
-            explosion.update()
-            if explosion.finished:
-                self.active_explosions.remove(explosion)
+    def update(self, now=None):
+        """
+        Advance all active effects to the given frame time.
         
-        # Update hit effects
-        for effect in self.active_hit_effects[:]:
-            effect.update()
-            if effect.finished:
-                self.active_hit_effects.remove(effect)
+        Args:
+            now: Frame clock in seconds, read once per frame by the caller
+                (defaults to the manager's clock). Effects only see differences
+                between calls, so any clock, e.g. a replay's frame counter
+                times FRAME_TIME, reproduces the same animation.
+        """
+        if now is None:
+            now = self.clock.now()
+        dt = 0.0 if self._last_update is None else now - self._last_update
+        self._last_update = now
+        
+        # Expire last frame's particles, then let effects spawn new ones
+        self.particles.update(dt)
+        self._update_effects(self.active_explosions, dt)
+        self._update_effects(self.active_hit_effects, dt)
+    
+    @staticmethod
+    def _update_effects(effects, dt):
+        """Update effects and drop finished ones by compacting in place."""
+        write = 0
+        for effect in effects:
+            effect.update(dt)
+            if not effect.finished:
+                effects[write] = effect
+                write += 1
+        del effects[write:]
     
     def get_all_particles(self):
         """
         Get all effect particles for rendering.
         
         Returns:
-            List of (x, y, char, effect_type) tuples
+            The ParticlePool; iterating it gives (x, y, char, effect_type)
+            tuples, with effect_type None when the level of detail draws
+            effects without color
         """
-        particles = []
-        
-        # Ball trail
-        for x, y, char in self.ball_trail.get_trail():
-            particles.append((x, y, char, 'trail'))
-        
-        # Explosions
-        for explosion in self.active_explosions:
-            for x, y, char in explosion.get_particles():
-                particles.append((x, y, char, 'explosion'))
-        
-        # Hit effects
-        for effect in self.active_hit_effects:
-            for x, y, char in effect.get_particles():
-                particles.append((x, y, char, 'hit'))
-        
-        return particles
+        return self.particles
     
     def clear(self):
         """Clear all effects."""
         self.ball_trail.clear()
         self.active_explosions.clear()
         self.active_hit_effects.clear()
-
+        self.particles.clear()
 
 # Goal celebration text frames
 GOAL_CELEBRATION = [
@@ -6,19 +6,41 @@ from config import (
 
 
 class GameState:
-    """Holds all game state data."""
+    """
+    Holds all game state data.
     
-    def __init__(self):
+    Slotted (no per-instance __dict__), with every field in FIELDS. A whole
+    state copies in one tuple pack/unpack via snapshot() and restore(), so
+    per-frame copies and state history never run reset() or allocate a
+    new GameState.
+    """
+    
+    FIELDS = (
+        'width', 'height', 'paddle1_x', 'paddle2_x',
+        'ball_x', 'ball_y', 'ball_vx', 'ball_vy', 'prev_ball_x', 'prev_ball_y',
+        'paddle1_y', 'paddle2_y', 'paddle1_height', 'paddle2_height',
+        'score1', 'score2', 'running', 'winner',
+    )
+    __slots__ = FIELDS
+    
+    def __init__(self, width=GAME_WIDTH, height=GAME_HEIGHT):
+        # Field size is fixed for the whole match
+        self.width = width
+        self.height = height
+        self.paddle1_x = 2
+        self.paddle2_x = width - 3
         self.reset()
     
     def reset(self):
         """Reset game to initial state."""
-        self.ball_x = GAME_WIDTH // 2
-        self.ball_y = GAME_HEIGHT // 2
+        self.ball_x = self.width // 2
+        self.ball_y = self.height // 2
         self.ball_vx = BALL_SPEED_X * random.choice([-1, 1])
         self.ball_vy = BALL_SPEED_Y * random.choice([-1, 1])
-        self.paddle1_y = GAME_HEIGHT // 2 - PADDLE_HEIGHT // 2
-        self.paddle2_y = GAME_HEIGHT // 2 - PADDLE_HEIGHT // 2
+        self.prev_ball_x = self.ball_x   # Ball position at the start of the tick
+        self.prev_ball_y = self.ball_y
+        self.paddle1_y = self.height // 2 - PADDLE_HEIGHT // 2
+        self.paddle2_y = self.height // 2 - PADDLE_HEIGHT // 2
         self.paddle1_height = PADDLE_HEIGHT  # Dynamic paddle height
         self.paddle2_height = PADDLE_HEIGHT  # Dynamic paddle height
         self.score1 = 0
@@ -26,9 +48,38 @@ class GameState:
         self.running = True
         self.winner = None
     
+    def snapshot(self):
+        """Return every field as a tuple, in FIELDS order."""
+        return (self.width, self.height, self.paddle1_x, self.paddle2_x,
+                self.ball_x, self.ball_y, self.ball_vx, self.ball_vy,
+                self.prev_ball_x, self.prev_ball_y,
+                self.paddle1_y, self.paddle2_y, self.paddle1_height, self.paddle2_height,
+                self.score1, self.score2, self.running, self.winner)
+    
+    def restore(self, snapshot):
+        """Overwrite every field from a snapshot() tuple."""
+        (self.width, self.height, self.paddle1_x, self.paddle2_x,
+         self.ball_x, self.ball_y, self.ball_vx, self.ball_vy,
+         self.prev_ball_x, self.prev_ball_y,
+         self.paddle1_y, self.paddle2_y, self.paddle1_height, self.paddle2_height,
+         self.score1, self.score2, self.running, self.winner) = snapshot
+    
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Build a state from a snapshot() tuple without running reset()."""
+        state = cls.__new__(cls)
+        state.restore(snapshot)
+        return state
+    
+    def copy_from(self, other):
+        """Copy every field of another state into this one."""
+        self.restore(other.snapshot())
+    
     def serialize(self):
         """Convert state to string for network transmission."""
-        return f"STATE,{self.ball_x:.2f},{self.ball_y:.2f},{self.paddle1_y},{self.paddle2_y},{self.score1},{self.score2}"
+        return (f"STATE,{self.ball_x:.2f},{self.ball_y:.2f},{self.paddle1_y},{self.paddle2_y},"
+                f"{self.score1},{self.score2},{self.width},{self.height},"
+                f"{self.paddle1_height},{self.paddle2_height}")
     
     @staticmethod
     def deserialize(data):
@@ -36,14 +87,50 @@ class GameState:
         parts = data.split(',')
         if parts[0] != 'STATE':
             return None
-        state = GameState()
-        state.ball_x = float(parts[1])
-        state.ball_y = float(parts[2])
-        state.paddle1_y = int(parts[3])
-        state.paddle2_y = int(parts[4])
-        state.score1 = int(parts[5])
-        state.score2 = int(parts[6])
-        return state
+        # Field size was added later; older peers send the default field
+        if len(parts) >= 9:
+            width, height = int(parts[7]), int(parts[8])
+        else:
+            width, height = GAME_WIDTH, GAME_HEIGHT
+        if len(parts) >= 11:
+            paddle1_height, paddle2_height = int(parts[9]), int(parts[10])
+        else:
+            paddle1_height = paddle2_height = PADDLE_HEIGHT
+        ball_x = float(parts[1])
+        ball_y = float(parts[2])
+        # Velocities are not sent
+        return GameState.from_snapshot((
+            width, height, 2, width - 3,
+            ball_x, ball_y, 0.0, 0.0, ball_x, ball_y,
+            int(parts[3]), int(parts[4]), paddle1_height, paddle2_height,
+            int(parts[5]), int(parts[6]), True, None,
+        ))
+
+
+def interpolate_state(previous, current, alpha, out):
+    """
+    Blend two simulation states for rendering.
+    
+    Args:
+        previous: State before the last simulation step
+        current: State after the last simulation step
+        alpha: Fraction of a step elapsed since then (0 = previous, 1 = current)
+        out: GameState to fill (reused between frames)
+    
+    Returns:
+        out, a copy of current with ball and paddle positions interpolated
+    """
+    out.copy_from(current)
+    if previous.width != current.width or previous.height != current.height:
+        return out
+    
+    # A goal teleports the ball to the center; don't blend across it
+    if previous.score1 == current.score1 and previous.score2 == current.score2:
+        out.ball_x = previous.ball_x + (current.ball_x - previous.ball_x) * alpha
+        out.ball_y = previous.ball_y + (current.ball_y - previous.ball_y) * alpha
+    out.paddle1_y = previous.paddle1_y + (current.paddle1_y - previous.paddle1_y) * alpha
+    out.paddle2_y = previous.paddle2_y + (current.paddle2_y - previous.paddle2_y) * alpha
+    return out
 
 
 class LobbyState:
@@ -0,0 +1,108 @@
+"""
+Terminal Geometry Module
+Caches the terminal size and refreshes it from SIGWINCH instead of polling.
+"""
+
+import shutil
+import signal
+import threading
+import time
+
+
+# Fallback size when the terminal cannot be queried
+DEFAULT_SIZE = (80, 24)
+
+# Without SIGWINCH (e.g. Windows) the size is re-read at most this often
+POLL_INTERVAL = 0.5
+
+
+def _query_size():
+    """Read the terminal size from the OS."""
+    try:
+        cols, rows = shutil.get_terminal_size()
+        return cols, rows
+    except (OSError, ValueError):
+        return DEFAULT_SIZE
+
+
+class TerminalGeometry:
+    """
+    Terminal size service.
+
+    The size is read once and then updated from a SIGWINCH handler. Every
+    change bumps `version`, so renderers and layout caches can compare one
+    integer to know whether they need to re-layout.
+    """
+
+    def __init__(self):
+        self.size = _query_size()
+        self.version = 0
+        self._handler_installed = False
+        self._last_poll = time.monotonic()
+
+    def install(self):
+        """
+        Install the SIGWINCH handler.
+
+        Returns:
+            bool: True if resize signals are now delivered to this service
+        """
+        if self._handler_installed:
+            return True
+        if not hasattr(signal, 'SIGWINCH'):
+            return False
+        if threading.current_thread() is not threading.main_thread():
+            return False
+
+        previous = signal.getsignal(signal.SIGWINCH)
+
+        def _on_resize(signum, frame):
+            self.refresh()
+            if callable(previous):
+                previous(signum, frame)
+
+        try:
+            signal.signal(signal.SIGWINCH, _on_resize)
+        except (ValueError, OSError):
+            return False
+
+        self._handler_installed = True
+        self.refresh()
+        return True
+
+    def refresh(self):
+        """Re-read the terminal size, bumping the version if it changed."""
+        size = _query_size()
+        self._last_poll = time.monotonic()
+        if size != self.size:
+            self.size = size
+            self.version += 1
+
+    def get_size(self):
+        """Get (cols, rows) without touching the OS when signals are available."""
+        if not self._handler_installed:
+            if not self.install():
+                # No signal delivery: fall back to rate-limited polling
+                if time.monotonic() - self._last_poll >= POLL_INTERVAL:
+                    self.refresh()
+        return self.size
+
+
+# Shared geometry service
+_geometry = TerminalGeometry()
+
+
+def get_geometry():
+    """Get the shared TerminalGeometry instance."""
+    return _geometry
+
+
+def get_size():
+    """Get the current terminal size as (cols, rows)."""
+    return _geometry.get_size()
+
+
+def get_version():
+    """Get the geometry version (changes whenever the size changes)."""
+    _geometry.get_size()
+    return _geometry.version
@@ -181,13 +181,37 @@ class InputHandler:
 
 def clear_screen():
     """Clear the terminal screen."""
-    print("\033[H\033[J", end="", flush=True)
+    from screen import invalidate_screen
+    from output import write
+    invalidate_screen()
+    write("\033[H\033[J")
+
+
+# Terminal attributes captured by save_terminal()
+_saved_tty_attrs = None
+
+
+def save_terminal():
+    """Remember the current terminal mode so restore_terminal() can return to it."""
+    global _saved_tty_attrs
+    if os.name == 'nt' or _saved_tty_attrs is not None:
+        return
+    import termios
+    try:
+        _saved_tty_attrs = termios.tcgetattr(sys.stdin.fileno())
+    except:
+        pass
 
 
 def restore_terminal():
-    """Restore terminal to normal mode."""
-    if os.name != 'nt':
-        os.system('stty sane')
+    """Restore terminal to the mode saved by save_terminal()."""
+    if os.name == 'nt' or _saved_tty_attrs is None:
+        return
+    import termios
+    try:
+        termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, _saved_tty_attrs)
+    except:
+        pass
 
 
 # ============================================================================
@@ -8,7 +8,6 @@ Uses Host-Client architecture over TCP sockets.
 Features: Chat Lobby, Real-time gameplay, ASCII UI
 """
 
-import re
 import time
 import logging
 
@@ -26,8 +25,11 @@ from ui_components import (
     draw_box_separator, center_text, PONG_TITLE_SIMPLE, generate_title,
     get_title_lines, center_block, get_menu_width
 )
-from server import GameServer
+from text_metrics import pad
+from screen import present, FullScreenSession, set_cursor_visible
+from async_server import AsyncGameServer
 from client import GameClient
+from geometry import get_geometry
 
 # Configure logging
 logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
@@ -43,19 +45,8 @@ MENU_OPTIONS = [
 ]
 
 
-def pad_line(content, width):
-    """Pad content to width, accounting for ANSI codes."""
-    visible = re.sub(r'\033\[[0-9;]*m', '', content)
-    padding = width - len(visible)
-    if padding > 0:
-        return content + ' ' * padding
-    return content
-
-
 def show_menu(selected=0):
     """Display main menu with arrow key navigation support."""
-    clear_screen()
-    
     w = get_menu_width()  # Dynamic width based on terminal
     inner_w = w - 2
     
@@ -71,20 +62,20 @@ def show_menu(selected=0):
     title_lines = get_title_lines("PONG-CLI", font="slant", width=w)
     for line in title_lines:
         line_content = center_text(line, inner_w)
-        line_padded = pad_line(line_content, inner_w)
+        line_padded = pad(line_content, inner_w)
         menu_lines.append(f"{vc}{colorize(line_padded, Style.WHITE)}{vc}")
     
     # 3. Subtitle
     subtitle = "CLI-Based Multiplayer Game"
     menu_lines.append(f"{vc}{' ' * inner_w}{vc}")
     sub_centered = center_text(subtitle, inner_w)
-    sub_padded = pad_line(sub_centered, inner_w)
+    sub_padded = pad(sub_centered, inner_w)
     menu_lines.append(f"{vc}{colorize(sub_padded, Style.DIM)}{vc}")
     
     # Description (10 words)
     desc = "Classic arcade action in your terminal with real-time multiplayer support."
     desc_centered = center_text(desc, inner_w)
-    desc_padded = pad_line(desc_centered, inner_w)
+    desc_padded = pad(desc_centered, inner_w)
     menu_lines.append(f"{vc}{colorize(desc_padded, Style.DIM)}{vc}")
     
     menu_lines.append(f"{vc}{' ' * inner_w}{vc}")
@@ -111,21 +102,19 @@ def show_menu(selected=0):
             else:
                 opt = f"         {dim(label)} {dim(hint)}"
         
-        menu_lines.append(f"{vc}{pad_line(opt, inner_w)}{vc}")
+        menu_lines.append(f"{vc}{pad(opt, inner_w)}{vc}")
     
     menu_lines.append(f"{vc}{' ' * inner_w}{vc}")
     
     # Navigation hint
     nav_hint = dim("  [W/S] Navigate  [Enter] Select  [Q] Quit")
-    menu_lines.append(f"{vc}{pad_line(nav_hint, inner_w)}{vc}")
+    menu_lines.append(f"{vc}{pad(nav_hint, inner_w)}{vc}")
     
     # Menu box bottom
     menu_lines.append(colorize(draw_box_bottom(w, 'rounded'), Style.WHITE))
     
     # Print centered block
-    centered_output = center_block(menu_lines)
-    for line in centered_output:
-        print(line)
+    present(center_block(menu_lines))
 
 
 def host_game():
@@ -137,7 +126,7 @@ def host_game():
     print()
     
     try:
-        server = GameServer()
+        server = AsyncGameServer()
         local_ip = server.start()
         
         print(success(f"  Server started on {local_ip}"))
@@ -168,7 +157,11 @@ def join_game():
     print(colorize(f"  {get_symbol('arrow_right')} {bold('JOIN MODE')}", Style.WHITE))
     print()
     
-    host_ip = input(f"  Enter Host IP Address: ").strip()
+    set_cursor_visible(True)
+    try:
+        host_ip = input(f"  Enter Host IP Address: ").strip()
+    finally:
+        set_cursor_visible(False)
     
     # Validate IP
     if not host_ip:
@@ -201,16 +194,25 @@ def join_game():
     restore_terminal()
 
 
-def play_vs_ai(input_handler, difficulty='medium'):
-    """Play against AI opponent."""
-    from game_state import GameState
+def play_vs_ai(input_handler, difficulty='medium', width=None, height=None, clock=None):
+    """
+    Play against AI opponent on a width x height field (default from config).
+    
+    clock drives the frame loop, pauses, effects and power-up timers
+    (default: clock.get_clock()); a VirtualClock runs the match unthrottled.
+    """
+    from game_state import GameState, interpolate_state
+    from timestep import FixedTimestep
     from physics import update_physics, move_paddle, process_physics_events
     from ai import AIController
     from sound import play_game_over, play_game_start
     from renderer import render_game_with_effects, show_game_over_ai
-    from config import FPS, FRAME_TIME
+    from config import FPS, FRAME_TIME, GAME_WIDTH, GAME_HEIGHT
     from effects import EffectsManager
     from powerups import PowerUpManager
+    from clock import get_clock
+    
+    clock = clock or get_clock()
     
     clear_screen()
     print()
@@ -218,57 +220,80 @@ def play_vs_ai(input_handler, difficulty='medium'):
     print(dim(f"  Difficulty: {difficulty.upper()}"))
     print()
     print(info("  Starting game..."))
-    time.sleep(1)
+    clock.sleep(1)
     
     # Initialize game
-    state = GameState()
+    state = GameState(width or GAME_WIDTH, height or GAME_HEIGHT)
     ai = AIController(difficulty)
-    effects = EffectsManager(use_unicode=True)
-    powerups = PowerUpManager()
+    effects = EffectsManager(use_unicode=True, clock=clock)
+    powerups = PowerUpManager(clock)
+    
+    # Simulation runs on a fixed timestep; frames render a blend of the
+    # last two simulation states
+    timestep = FixedTimestep()
+    previous = GameState(state.width, state.height)
+    previous.copy_from(state)
+    render_state = GameState(state.width, state.height)
+    pending_move = None
     
     # input_handler already running
     input_handler.set_mode("key")
     
     play_game_start()
     
-    last_frame_time = time.time()
+    last_frame_time = clock.now()
+    timestep.advance(last_frame_time)
     
     try:
         while state.running:
-            current_time = time.time()
+            current_time = clock.now()
             
             # Frame rate control
             elapsed = current_time - last_frame_time
             if elapsed < FRAME_TIME:
-                time.sleep(FRAME_TIME - elapsed)
-                current_time = time.time()
+                clock.sleep(FRAME_TIME - elapsed)
+                current_time = clock.now()
             last_frame_time = current_time
             
-            # Handle player input
+            # Handle player input (applied on the next simulation step)
             key = input_handler.get_key()
             if key == 'Q':
                 break
             elif key == 'W' or key == 'UP':
-                move_paddle(state, 1, 'W')
+                pending_move = 'W'
             elif key == 'S' or key == 'DOWN':
-                move_paddle(state, 1, 'S')
-            
-            # AI move
-            ai_move = ai.update(state)
-            if ai_move:
-                move_paddle(state, 2, ai_move)
-            
-            # Update physics with events
-            events = update_physics(state, return_events=True)
-            
-            # Process events for sound and visual effects
-            process_physics_events(events, effects)
+                pending_move = 'S'
             
-            # Update power-ups
-            powerups.update(state, current_time)
+            for _ in range(timestep.advance(current_time)):
+                previous.copy_from(state)
+                
+                if pending_move:
+                    move_paddle(state, 1, pending_move)
+                    pending_move = None
+                
+                # AI move
+                ai_move = ai.update(state)
+                if ai_move:
+                    move_paddle(state, 2, ai_move)
+                
+                # Update physics with events
+                events = update_physics(state, return_events=True)
+                
+                # Process events for sound and visual effects
+                process_physics_events(events, effects)
+                
+                # Update power-ups
+                powerups.update(state, current_time, events.ball_path)
+                
+                if not state.running:
+                    break
             
             # Render with effects
-            render_game_with_effects(state, 1, effects, powerups)
+            interpolate_state(previous, state, timestep.alpha, render_state)
+            render_game_with_effects(render_state, 1, effects, powerups, current_time)
+            
+            # Let effects detail follow the frame-time budget
+            effects.record_frame_time(clock.now() - current_time)
     
     except KeyboardInterrupt:
         pass
@@ -277,7 +302,7 @@ def play_vs_ai(input_handler, difficulty='medium'):
     if state.winner:
         play_game_over()
         show_game_over_ai(state.winner)
-        time.sleep(3)
+        clock.sleep(3)
 
 
     # restore_terminal() removed - keep handler running for menu
@@ -293,8 +318,6 @@ def select_ai_difficulty(input_handler):
     
     try:
         while True:
-            clear_screen()
-            
             w = get_menu_width()
             inner_w = w - 2
             v = get_box_char('v')
@@ -307,7 +330,7 @@ def select_ai_difficulty(input_handler):
             
             # Title - centered with padding
             title = bold("Select Difficulty")
-            title_padded = pad_line(center_text(title, inner_w), inner_w)
+            title_padded = pad(center_text(title, inner_w), inner_w)
             lines.append(f"{vc}{title_padded}{vc}")
             
             # Separator
@@ -321,22 +344,21 @@ def select_ai_difficulty(input_handler):
                     opt = f"{colorize(arrow, Style.GREEN)} {bold(diff)}"
                 else:
                     opt = f"  {dim(diff)}"
-                opt_padded = pad_line(center_text(opt, inner_w), inner_w)
+                opt_padded = pad(center_text(opt, inner_w), inner_w)
                 lines.append(f"{vc}{opt_padded}{vc}")
             
             lines.append(f"{vc}{' ' * inner_w}{vc}")
             
             # Navigation hint - centered
             nav = dim("[W/S] Navigate  [Enter] Select  [Q] Back")
-            nav_padded = pad_line(center_text(nav, inner_w), inner_w)
+            nav_padded = pad(center_text(nav, inner_w), inner_w)
             lines.append(f"{vc}{nav_padded}{vc}")
             
             # Box bottom
             lines.append(colorize(draw_box_bottom(w, 'rounded'), Style.WHITE))
             
             # Print centered
-            for line in center_block(lines):
-                print(line)
+            present(center_block(lines))
             
             # Wait for input
             while True:
@@ -428,14 +450,17 @@ def main():
     """Main entry point."""
     logger.info("Terminal Pong started")
     
+    # Track terminal resizes via SIGWINCH (must happen on the main thread)
+    get_geometry().install()
+    
     try:
-        run_menu()
+        with FullScreenSession():
+            run_menu()
     
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
     
     finally:
-        clear_screen()
         print()
         print(colorize("  Thank you for playing Terminal Pong!", Style.WHITE))
         print()
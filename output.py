@@ -0,0 +1,232 @@
+"""
+Output Module
+Pluggable output sinks for everything the renderers write to the terminal.
+"""
+
+import io
+import os
+import select
+import sys
+
+
+# Largest write a writable pipe or terminal takes without blocking
+WRITE_CHUNK = getattr(select, 'PIPE_BUF', 512)
+
+
+class OutputSink:
+    """
+    Base class for render targets.
+
+    Writes are collected until flush(), which encodes the whole frame once
+    and hands it to the sink in a single call. Keeps simple counters so
+    benchmarks can report bytes and frames.
+    """
+
+    def __init__(self):
+        self._frame = []
+        self.bytes_written = 0
+        self.writes = 0
+        self.frames = 0
+        self.dropped_frames = 0
+
+    def write(self, data):
+        """Add rendered text to the current frame."""
+        self._frame.append(data)
+        self.writes += 1
+
+    def flush(self, droppable=False):
+        """
+        End the current frame and send it.
+
+        Args:
+            droppable: True if the frame may be skipped when the output is
+                still busy with an earlier frame (the caller must then
+                treat it as never shown)
+
+        Returns:
+            bool: True if the frame was accepted
+        """
+        if not self._frame:
+            # Nothing new, but give the sink a chance to catch up
+            self._drain()
+            return True
+        data = "".join(self._frame).encode('utf-8')
+        self._frame.clear()
+        if not self._emit(data, droppable):
+            self.dropped_frames += 1
+            return False
+        self.bytes_written += len(data)
+        self.frames += 1
+        return True
+
+    def _emit(self, data, droppable):
+        """Send one encoded frame. Returns False if it was dropped."""
+        return True
+
+    def _drain(self):
+        """Send output still pending from earlier frames, if any."""
+
+    def close(self):
+        """Release any resources held by the sink."""
+
+    def reset_stats(self):
+        """Reset the counters."""
+        self.bytes_written = 0
+        self.writes = 0
+        self.frames = 0
+        self.dropped_frames = 0
+
+
+class TTYSink(OutputSink):
+    """
+    Writes to the real terminal (sys.stdout, looked up on every frame).
+
+    Frames are written to the stdout file descriptor only as far as it
+    is writable right now (checked with a zero-timeout select, so the
+    descriptor's flags, shared with stdin on a terminal, are never
+    touched). The unwritten tail of a frame stays pending and is sent by
+    later flushes, including empty ones, so it drains even while the
+    screen is idle. While a tail is pending, droppable frames are
+    skipped; other output is appended and written out blocking. Game
+    frames therefore don't wait on a slow terminal or SSH pipe; only
+    menus and messages do.
+    """
+
+    def __init__(self, stream=None):
+        super().__init__()
+        self.stream = stream
+        self._pending = b""
+
+    def _get_fd(self, stream):
+        """Get the stream's file descriptor, or None if it has none."""
+        try:
+            return stream.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return None
+
+    def _write_blocking(self, fd):
+        """Write all pending data, waiting for the terminal if needed."""
+        while self._pending:
+            written = os.write(fd, self._pending)
+            self._pending = self._pending[written:]
+
+    def _write_nonblocking(self, fd):
+        """Write as much pending data as the fd accepts without waiting."""
+        while self._pending:
+            try:
+                writable = select.select([], [fd], [], 0)[1]
+            except (OSError, ValueError):
+                # fd cannot be polled on this platform: write everything
+                self._write_blocking(fd)
+                return
+            if not writable:
+                return
+            try:
+                written = os.write(fd, self._pending[:WRITE_CHUNK])
+            except BlockingIOError:
+                return
+            self._pending = self._pending[written:]
+
+    def _drain(self):
+        if not self._pending:
+            return
+        fd = self._get_fd(self.stream or sys.stdout)
+        if fd is not None:
+            self._write_nonblocking(fd)
+
+    def _emit(self, data, droppable):
+        stream = self.stream or sys.stdout
+        fd = self._get_fd(stream)
+        if fd is None:
+            # Not a real file (e.g. redirected to StringIO)
+            stream.write(data.decode('utf-8'))
+            stream.flush()
+            return True
+
+        # Anything print() buffered must reach the terminal first
+        stream.flush()
+
+        if self._pending:
+            self._write_nonblocking(fd)
+            if self._pending and droppable:
+                return False
+
+        self._pending += data
+        self._write_nonblocking(fd)
+
+        if self._pending and not droppable:
+            # Menus and messages must not be lost: finish them blocking
+            self._write_blocking(fd)
+        return True
+
+
+class BufferSink(OutputSink):
+    """Collects output in memory (for tests and headless rendering)."""
+
+    def __init__(self):
+        super().__init__()
+        self.chunks = []
+
+    def _emit(self, data, droppable):
+        self.chunks.append(data)
+        return True
+
+    def getvalue(self):
+        """Get everything written so far."""
+        return b"".join(self.chunks).decode('utf-8')
+
+    def clear(self):
+        """Drop collected output."""
+        self.chunks.clear()
+
+
+class NullSink(OutputSink):
+    """Writes to /dev/null, so the encode and write cost is still paid."""
+
+    def __init__(self):
+        super().__init__()
+        self._fd = os.open(os.devnull, os.O_WRONLY)
+
+    def _emit(self, data, droppable):
+        os.write(self._fd, data)
+        return True
+
+    def close(self):
+        """Close the /dev/null handle."""
+        os.close(self._fd)
+
+
+# Active sink used by all renderers
+_sink = TTYSink()
+
+
+def get_sink():
+    """Get the active output sink."""
+    return _sink
+
+
+def set_sink(sink):
+    """
+    Replace the active output sink.
+
+    Returns:
+        The previous sink, so callers can restore it
+    """
+    global _sink
+    previous = _sink
+    _sink = sink
+    return previous
+
+
+def write(data):
+    """Write text to the active sink and end the frame."""
+    _sink.write(data)
+    _sink.flush()
+
+
+def write_lines(lines):
+    """Write a block of lines, each followed by a newline, as one frame."""
+    if not lines:
+        return
+    _sink.write("\n".join(lines) + "\n")
+    _sink.flush()
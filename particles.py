@@ -0,0 +1,117 @@
+"""
+Particles Module
+Fixed-capacity particle pool stored as parallel arrays (struct of arrays).
+"""
+
+from array import array
+
+from config import PARTICLE_POOL_CAPACITY
+
+
+# Particle kinds, stored as small integers in the pool
+KIND_TRAIL = 0
+KIND_EXPLOSION = 1
+KIND_HIT = 2
+KIND_NAMES = ('trail', 'explosion', 'hit')
+
+# Life at or below this is treated as expired (absorbs float rounding)
+LIFE_EPSILON = 1e-9
+
+
+class ParticlePool:
+    """
+    Pool of live effect particles.
+
+    Each attribute (x, y, glyph, kind, life) is one preallocated array and
+    particle i is index i in all of them; only the first `count` entries
+    are live. Expired particles are removed by compacting the arrays in
+    place, so spawning, aging and drawing allocate no per-frame lists.
+
+    Glyphs are stored as indexes into `glyphs`, which grows as new
+    characters are first spawned.
+    """
+
+    def __init__(self, capacity=PARTICLE_POOL_CAPACITY):
+        """
+        Initialize an empty pool.
+
+        Args:
+            capacity: Maximum number of live particles
+        """
+        self.capacity = capacity
+        self.x = array('d', bytes(8 * capacity))
+        self.y = array('d', bytes(8 * capacity))
+        self.glyph = array('H', bytes(2 * capacity))
+        self.kind = array('B', bytes(capacity))
+        self.life = array('d', bytes(8 * capacity))
+        self.count = 0
+        self.dropped = 0          # Spawns refused because the pool was full
+        self.colored = True       # False draws particles without effect colors
+        self.glyphs = []
+        self._glyph_index = {}
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        """Iterate live particles as (x, y, char, effect_type) tuples."""
+        glyphs = self.glyphs
+        colored = self.colored
+        for i in range(self.count):
+            effect_type = KIND_NAMES[self.kind[i]] if colored else None
+            yield self.x[i], self.y[i], glyphs[self.glyph[i]], effect_type
+
+    def glyph_code(self, char):
+        """Get the glyph index for a character, adding it if new."""
+        code = self._glyph_index.get(char)
+        if code is None:
+            code = len(self.glyphs)
+            self.glyphs.append(char)
+            self._glyph_index[char] = code
+        return code
+
+    def spawn(self, x, y, char, kind, life):
+        """
+        Add a particle.
+
+        Args:
+            x, y: Field position
+            char: Glyph to draw
+            kind: KIND_TRAIL, KIND_EXPLOSION or KIND_HIT
+            life: Seconds the particle stays alive (0 = until the next update)
+
+        Returns:
+            bool: False if the pool is full and the particle was dropped
+        """
+        i = self.count
+        if i >= self.capacity:
+            self.dropped += 1
+            return False
+        self.x[i] = x
+        self.y[i] = y
+        self.glyph[i] = self.glyph_code(char)
+        self.kind[i] = kind
+        self.life[i] = life
+        self.count = i + 1
+        return True
+
+    def update(self, dt):
+        """Age all particles by dt seconds and compact out expired ones."""
+        x, y, glyph, kind, life = self.x, self.y, self.glyph, self.kind, self.life
+        write = 0
+        for read in range(self.count):
+            remaining = life[read] - dt
+            if remaining <= LIFE_EPSILON:
+                continue
+            if write != read:
+                x[write] = x[read]
+                y[write] = y[read]
+                glyph[write] = glyph[read]
+                kind[write] = kind[read]
+            life[write] = remaining
+            write += 1
+        self.count = write
+
+    def clear(self):
+        """Remove all particles."""
+        self.count = 0
@@ -6,7 +6,7 @@ Includes event callbacks for sound and visual effects.
 
 import random
 from config import (
-    GAME_WIDTH, GAME_HEIGHT, PADDLE_HEIGHT, WIN_SCORE,
+    PADDLE_HEIGHT, WIN_SCORE,
     BALL_SPEED_X, BALL_SPEED_Y
 )
 
@@ -21,12 +21,23 @@ class PhysicsEvents:
         self.goal_scored = None  # 1 or 2 (which player scored)
         self.goal_position = None  # (x, y) where ball crossed
         self.paddle_hit_position = None  # (x, y, height) of paddle hit
+        self.ball_path = None  # [(x, y), ...] start, each bounce point, end of the tick
+
+
+# Walls and paddles resolved per tick; later motion in the tick is dropped
+MAX_COLLISIONS_PER_TICK = 4
 
 
 def update_physics(state, return_events=False):
     """
     Update ball position and handle collisions.
     
+    The ball's motion over the tick is swept as a segment: the earliest
+    wall or paddle it reaches is found by time of impact, the ball is
+    reflected there, and the rest of the motion continues from that
+    point. Fast balls (e.g. SpeedBoost) therefore cannot pass through a
+    paddle between ticks, whatever the tick rate.
+    
     Args:
         state: GameState object
         return_events: If True, return PhysicsEvents object
@@ -36,46 +47,92 @@ def update_physics(state, return_events=False):
     """
     events = PhysicsEvents() if return_events else None
     
-    # Store previous position for collision detection
-    prev_x = state.ball_x
-    prev_y = state.ball_y
-    
-    # Update position
-    state.ball_x += state.ball_vx
-    state.ball_y += state.ball_vy
-    
-    # Top/Bottom wall collision
-    if state.ball_y <= 0 or state.ball_y >= GAME_HEIGHT - 1:
-        state.ball_vy = -state.ball_vy
-        state.ball_y = max(0, min(GAME_HEIGHT - 1, state.ball_y))
-        if events:
-            events.wall_bounce = True
+    # Store previous position for swept checks (e.g. power-up pickup)
+    state.prev_ball_x = state.ball_x
+    state.prev_ball_y = state.ball_y
     
     # Get paddle heights (support for power-ups)
     paddle1_height = getattr(state, 'paddle1_height', PADDLE_HEIGHT)
     paddle2_height = getattr(state, 'paddle2_height', PADDLE_HEIGHT)
     
-    # Left paddle collision (Player 1)
-    paddle1_x = 2
-    if state.ball_x <= paddle1_x + 1 and state.ball_vx < 0:
-        if state.paddle1_y <= state.ball_y <= state.paddle1_y + paddle1_height:
-            state.ball_vx = -state.ball_vx
-            state.ball_x = paddle1_x + 1
-            
+    top = 0
+    bottom = state.height - 1
+    left_plane = state.paddle1_x + 1     # Ball x where it meets paddle 1
+    right_plane = state.paddle2_x - 1    # Ball x where it meets paddle 2
+    
+    x = state.ball_x
+    y = state.ball_y
+    remaining = 1.0  # Fraction of the tick still to move
+    if events:
+        events.ball_path = [(x, y)]
+    
+    for _ in range(MAX_COLLISIONS_PER_TICK):
+        vx = state.ball_vx
+        vy = state.ball_vy
+        end_x = x + vx * remaining
+        end_y = y + vy * remaining
+        
+        # Earliest impact in this tick: (time, kind)
+        impact_time = None
+        impact = None
+        
+        # Top/Bottom walls
+        if vy < 0 and end_y <= top:
+            impact_time, impact = max(0.0, (top - y) / vy), 'wall'
+        elif vy > 0 and end_y >= bottom:
+            impact_time, impact = max(0.0, (bottom - y) / vy), 'wall'
+        
+        # Paddles: the segment must cross the paddle's plane from the front,
+        # and the paddle must cover the ball's y at that moment
+        if vx < 0 and x >= left_plane and end_x <= left_plane:
+            t = (left_plane - x) / vx
+            if impact_time is None or t < impact_time:
+                hit_y = y + vy * t
+                if state.paddle1_y <= hit_y <= state.paddle1_y + paddle1_height:
+                    impact_time, impact = t, 'paddle1'
+        elif vx > 0 and x <= right_plane and end_x >= right_plane:
+            t = (right_plane - x) / vx
+            if impact_time is None or t < impact_time:
+                hit_y = y + vy * t
+                if state.paddle2_y <= hit_y <= state.paddle2_y + paddle2_height:
+                    impact_time, impact = t, 'paddle2'
+        
+        if impact is None:
+            x, y = end_x, end_y
+            break
+        
+        # Move to the point of impact and reflect
+        x += vx * impact_time
+        y += vy * impact_time
+        remaining -= impact_time
+        
+        if impact == 'wall':
+            state.ball_vy = -vy
+            y = max(top, min(bottom, y))
+            if events:
+                events.wall_bounce = True
+        elif impact == 'paddle1':
+            state.ball_vx = -vx
+            x = left_plane
             if events:
                 events.paddle1_hit = True
-                events.paddle_hit_position = (paddle1_x, state.paddle1_y, paddle1_height)
-    
-    # Right paddle collision (Player 2)
-    paddle2_x = GAME_WIDTH - 3
-    if state.ball_x >= paddle2_x - 1 and state.ball_vx > 0:
-        if state.paddle2_y <= state.ball_y <= state.paddle2_y + paddle2_height:
-            state.ball_vx = -state.ball_vx
-            state.ball_x = paddle2_x - 1
-            
+                events.paddle_hit_position = (state.paddle1_x, state.paddle1_y, paddle1_height)
+        else:
+            state.ball_vx = -vx
+            x = right_plane
             if events:
                 events.paddle2_hit = True
-                events.paddle_hit_position = (paddle2_x, state.paddle2_y, paddle2_height)
+                events.paddle_hit_position = (state.paddle2_x, state.paddle2_y, paddle2_height)
+        
+        if events:
+            events.ball_path.append((x, y))
+        if remaining <= 0:
+            break
+    
+    state.ball_x = x
+    state.ball_y = max(top, min(bottom, y))
+    if events:
+        events.ball_path.append((state.ball_x, state.ball_y))
     
     # Scoring
     if state.ball_x <= 0:
@@ -84,7 +141,7 @@ def update_physics(state, return_events=False):
             events.goal_scored = 2
             events.goal_position = (int(state.ball_x), int(state.ball_y))
         reset_ball(state, direction=1)
-    elif state.ball_x >= GAME_WIDTH - 1:
+    elif state.ball_x >= state.width - 1:
         state.score1 += 1
         if events:
             events.goal_scored = 1
@@ -102,10 +159,38 @@ def update_physics(state, return_events=False):
     return events
 
 
+def segment_hits_box(x0, y0, x1, y1, left, top, right, bottom):
+    """
+    Check whether the segment (x0, y0)-(x1, y1) touches an axis-aligned box.
+    
+    Returns:
+        Fraction along the segment of the first contact (0..1), or None
+    """
+    t_enter = 0.0
+    t_exit = 1.0
+    for start, delta, low, high in ((x0, x1 - x0, left, right), (y0, y1 - y0, top, bottom)):
+        if delta == 0:
+            if start < low or start > high:
+                return None
+            continue
+        t_low = (low - start) / delta
+        t_high = (high - start) / delta
+        if t_low > t_high:
+            t_low, t_high = t_high, t_low
+        t_enter = max(t_enter, t_low)
+        t_exit = min(t_exit, t_high)
+        if t_enter > t_exit:
+            return None
+    return t_enter
+
+
 def reset_ball(state, direction):
     """Reset ball to center after scoring."""
-    state.ball_x = GAME_WIDTH // 2
-    state.ball_y = GAME_HEIGHT // 2
+    state.ball_x = state.width // 2
+    state.ball_y = state.height // 2
+    # The ball teleports, so there is no path to sweep this tick
+    state.prev_ball_x = state.ball_x
+    state.prev_ball_y = state.ball_y
     state.ball_vx = BALL_SPEED_X * direction
     state.ball_vy = BALL_SPEED_Y * random.choice([-1, 1])
 
@@ -120,12 +205,12 @@ def move_paddle(state, player_id, direction):
         if direction == 'W':
             state.paddle1_y = max(0, state.paddle1_y - 1)
         elif direction == 'S':
-            state.paddle1_y = min(GAME_HEIGHT - paddle1_height, state.paddle1_y + 1)
+            state.paddle1_y = min(state.height - paddle1_height, state.paddle1_y + 1)
     else:
         if direction == 'W':
             state.paddle2_y = max(0, state.paddle2_y - 1)
         elif direction == 'S':
-            state.paddle2_y = min(GAME_HEIGHT - paddle2_height, state.paddle2_y + 1)
+            state.paddle2_y = min(state.height - paddle2_height, state.paddle2_y + 1)
 
 
 def process_physics_events(events, effects_manager=None):
@@ -4,8 +4,9 @@ Game modifiers that spawn on the field and affect gameplay.
 """
 
 import random
-import time
-from config import GAME_WIDTH, GAME_HEIGHT
+
+from physics import segment_hits_box
+from clock import get_clock
 
 
 class PowerUp:
@@ -21,17 +22,19 @@ class PowerUp:
         self.symbol = '?'
         self.name = 'Unknown'
     
-    def apply(self, state, player_id):
-        """Apply power-up effect to game state."""
+    def apply(self, state, player_id, now=None):
+        """Apply power-up effect to game state (now: game clock, default get_clock())."""
         self.collected = True
         self.active = False
-        self.effect_start_time = time.time()
+        self.effect_start_time = get_clock().now() if now is None else now
     
-    def is_effect_expired(self):
+    def is_effect_expired(self, now=None):
         """Check if power-up effect has expired."""
         if self.effect_start_time is None:
             return False
-        return time.time() - self.effect_start_time >= self.effect_duration
+        if now is None:
+            now = get_clock().now()
+        return now - self.effect_start_time >= self.effect_duration
     
     def remove_effect(self, state):
         """Remove power-up effect from game state."""
@@ -47,8 +50,8 @@ class SpeedBoost(PowerUp):
         self.name = 'Speed+'
         self.speed_multiplier = 1.5
     
-    def apply(self, state, player_id):
-        super().apply(state, player_id)
+    def apply(self, state, player_id, now=None):
+        super().apply(state, player_id, now)
         state.ball_vx *= self.speed_multiplier
         state.ball_vy *= self.speed_multiplier
     
@@ -67,8 +70,8 @@ class PaddleGrow(PowerUp):
         self.size_increase = 2
         self.affected_player = None
     
-    def apply(self, state, player_id):
-        super().apply(state, player_id)
+    def apply(self, state, player_id, now=None):
+        super().apply(state, player_id, now)
         self.affected_player = player_id
         if player_id == 1:
             state.paddle1_height = getattr(state, 'paddle1_height', 4) + self.size_increase
@@ -92,8 +95,8 @@ class PaddleShrink(PowerUp):
         self.size_decrease = 2
         self.affected_player = None
     
-    def apply(self, state, player_id):
-        super().apply(state, player_id)
+    def apply(self, state, player_id, now=None):
+        super().apply(state, player_id, now)
         # Shrink opponent's paddle
         opponent = 2 if player_id == 1 else 1
         self.affected_player = opponent
@@ -114,49 +117,67 @@ class PowerUpManager:
     
     POWER_UP_TYPES = [SpeedBoost, PaddleGrow, PaddleShrink]
     
-    def __init__(self):
+    def __init__(self, clock=None):
+        self.clock = clock or get_clock()
         self.active_powerups = []      # PowerUps on field (not collected)
         self.active_effects = []       # Applied effects with timers
         self.last_spawn_time = 0
         self.spawn_interval = 10.0     # Spawn every 10 seconds
         self.enabled = True
     
-    def update(self, state, current_time):
-        """Update power-ups: spawn new ones, check collections, expire effects."""
+    def update(self, state, current_time=None, ball_path=None):
+        """
+        Update power-ups: spawn new ones, check collections, expire effects.
+        
+        Args:
+            state: GameState after this tick's physics
+            current_time: Game time used for spawning and effect timers
+                (defaults to the manager's clock)
+            ball_path: The ball's path this tick, PhysicsEvents.ball_path,
+                including wall and paddle bounces. Without it only the
+                straight line from prev_ball_x/y to ball_x/y is checked,
+                which misses power-ups on a path that bounced.
+        """
         if not self.enabled:
             return
+        if current_time is None:
+            current_time = self.clock.now()
         
         # Spawn new power-up
         if current_time - self.last_spawn_time >= self.spawn_interval:
-            self._spawn_powerup()
+            self._spawn_powerup(state)
             self.last_spawn_time = current_time
         
-        # Check for power-up collection (ball collision)
-        ball_x = int(state.ball_x)
-        ball_y = int(state.ball_y)
+        # Check for power-up collection: the ball's path this tick must pass
+        # within one cell of the power-up (swept, so fast balls can't skip it)
+        if ball_path is None:
+            ball_path = ((state.prev_ball_x, state.prev_ball_y), (state.ball_x, state.ball_y))
         
         for powerup in self.active_powerups[:]:
-            if abs(powerup.x - ball_x) <= 1 and abs(powerup.y - ball_y) <= 1:
-                # Determine which player collected (based on ball direction)
-                player_id = 1 if state.ball_vx > 0 else 2
-                powerup.apply(state, player_id)
-                self.active_powerups.remove(powerup)
-                self.active_effects.append(powerup)
+            for (x0, y0), (x1, y1) in zip(ball_path, ball_path[1:]):
+                if segment_hits_box(x0, y0, x1, y1, powerup.x - 1, powerup.y - 1,
+                                    powerup.x + 2, powerup.y + 2) is not None:
+                    # Determine which player collected (ball direction on that stretch)
+                    player_id = 1 if (x1 - x0 if x1 != x0 else state.ball_vx) > 0 else 2
+                    powerup.apply(state, player_id, current_time)
+                    self.active_powerups.remove(powerup)
+                    self.active_effects.append(powerup)
+                    break
         
         # Expire old effects
         for effect in self.active_effects[:]:
-            if effect.is_effect_expired():
+            if effect.is_effect_expired(current_time):
                 effect.remove_effect(state)
                 self.active_effects.remove(effect)
     
-    def _spawn_powerup(self):
-        """Spawn a random power-up on the field."""
+    def _spawn_powerup(self, state):
+        """Spawn a random power-up on the state's field."""
         if len(self.active_powerups) >= 2:  # Max 2 power-ups on field
             return
         
         # Random position (avoid edges and paddles)
-        x = random.randint(GAME_WIDTH // 4, 3 * GAME_WIDTH // 4)
-        y = random.randint(2, GAME_HEIGHT - 3)
+        x = random.randint(state.width // 4, 3 * state.width // 4)
+        y = random.randint(2, state.height - 3)
         
         # Random power-up type
         PowerUpClass = random.choice(self.POWER_UP_TYPES)
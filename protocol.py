@@ -0,0 +1,309 @@
+"""
+Protocol Module
+Binary snapshot encoding and message framing for the game connection.
+
+Messages are newline-terminated text (PLAYER, LOBBY_STATE, INPUT, ...)
+unless both ends negotiate binary snapshots with HELLO:
+
+    C->S  HELLO,<client version>
+    S->C  HELLO,<agreed version>     (0 = text only)
+
+From then on the server may send binary frames, which start with a NUL
+byte (text messages never do):
+
+    FRAME_MARKER  kind  payload
+
+Version 1 sends a full snapshot every tick. Version 2 clients answer
+each snapshot with ACK,<tick> and get deltas against the last
+acknowledged one, with periodic full keyframes. Old clients never send
+HELLO and keep receiving STATE text messages.
+"""
+
+import struct
+
+from config import SNAPSHOT_KEYFRAME_INTERVAL
+from game_state import GameState
+
+
+PROTOCOL_VERSION = 2
+PROTOCOL_DELTA = 2              # First version with delta snapshots and ACK
+
+FRAME_MARKER = 0
+FRAME_SNAPSHOT = 1
+FRAME_DELTA = 2
+
+# Ball position is sent in 1/BALL_SCALE cell fixed point (fields up to
+# 1023 cells wide)
+BALL_SCALE = 64
+BALL_MAX = 0xFFFF
+
+FLAG_RUNNING = 0x01
+FLAG_WINNER_SHIFT = 1           # Bits 1-2: winner (0 = none, 1 or 2)
+FLAG_WINNER_MASK = 0x06
+
+# Snapshot fields in wire order (ball in fixed point, flags = FLAG_*)
+FIELDS = (
+    'width', 'height', 'ball_x', 'ball_y', 'paddle1_y', 'paddle2_y',
+    'paddle1_height', 'paddle2_height', 'score1', 'score2', 'flags',
+)
+FIELD_FORMATS = 'HHHHHHBBBBB'
+
+# Full snapshot: marker, kind, tick, then every field
+SNAPSHOT = struct.Struct('<BBI' + FIELD_FORMATS)
+
+# Delta: marker, kind, tick, ticks back to the baseline, mask of changed
+# fields (bit i = FIELDS[i]), then the changed fields in order
+DELTA_HEADER = struct.Struct('<BBIBH')
+MAX_DELTA_AGE = 255
+
+_FIELD_SIZES = [struct.calcsize('<' + fmt) for fmt in FIELD_FORMATS]
+_delta_structs = {}
+
+
+def _delta_struct(mask):
+    """Struct for the changed fields of a delta (cached per mask)."""
+    packer = _delta_structs.get(mask)
+    if packer is None:
+        fmt = ''.join(f for i, f in enumerate(FIELD_FORMATS) if mask >> i & 1)
+        packer = _delta_structs[mask] = struct.Struct('<' + fmt)
+    return packer
+
+
+def hello_message(version=PROTOCOL_VERSION):
+    """HELLO message offering (client) or accepting (server) a version."""
+    return f"HELLO,{version}"
+
+
+def parse_hello(message):
+    """
+    Parse a HELLO message.
+
+    Returns:
+        Protocol version, or 0 if malformed
+    """
+    try:
+        return max(0, int(message.split(',', 1)[1]))
+    except (IndexError, ValueError):
+        return 0
+
+
+def _fixed(value):
+    """Quantize a ball coordinate."""
+    return min(BALL_MAX, max(0, int(round(value * BALL_SCALE))))
+
+
+def snapshot_fields(state):
+    """Quantize a GameState into a tuple of wire fields (FIELDS order)."""
+    return (
+        state.width, state.height,
+        _fixed(state.ball_x), _fixed(state.ball_y),
+        state.paddle1_y, state.paddle2_y,
+        state.paddle1_height, state.paddle2_height,
+        state.score1, state.score2,
+        (FLAG_RUNNING if state.running else 0) | ((state.winner or 0) << FLAG_WINNER_SHIFT),
+    )
+
+
+def state_from_fields(fields):
+    """
+    Build a GameState from wire fields.
+
+    Velocities are not sent, so the state has zero ball velocity.
+    """
+    (width, height, ball_x, ball_y, paddle1_y, paddle2_y,
+     paddle1_height, paddle2_height, score1, score2, flags) = fields
+    ball_x /= BALL_SCALE
+    ball_y /= BALL_SCALE
+    return GameState.from_snapshot((
+        width, height, 2, width - 3,
+        ball_x, ball_y, 0.0, 0.0, ball_x, ball_y,
+        paddle1_y, paddle2_y, paddle1_height, paddle2_height,
+        score1, score2, bool(flags & FLAG_RUNNING),
+        (flags & FLAG_WINNER_MASK) >> FLAG_WINNER_SHIFT or None,
+    ))
+
+
+def encode_snapshot(fields, tick):
+    """
+    Pack wire fields into a full binary snapshot frame.
+
+    Args:
+        fields: Wire fields to send (snapshot_fields)
+        tick: Server simulation tick the fields belong to
+
+    Returns:
+        bytes (SNAPSHOT.size long)
+    """
+    return SNAPSHOT.pack(FRAME_MARKER, FRAME_SNAPSHOT, tick & 0xFFFFFFFF, *fields)
+
+
+def decode_snapshot(frame):
+    """
+    Unpack a full binary snapshot frame.
+
+    Returns:
+        (fields, tick)
+    """
+    values = SNAPSHOT.unpack(frame)
+    return values[3:], values[2]
+
+
+def encode_delta(fields, tick, base_fields, base_tick):
+    """
+    Pack the fields that differ from a baseline into a delta frame.
+
+    Args:
+        fields: Wire fields to send (snapshot_fields)
+        tick: Tick of fields
+        base_fields: Wire fields the receiver already has
+        base_tick: Tick of base_fields (1 to MAX_DELTA_AGE ticks earlier)
+
+    Returns:
+        bytes
+    """
+    mask = 0
+    changed = []
+    for i, (value, base) in enumerate(zip(fields, base_fields)):
+        if value != base:
+            mask |= 1 << i
+            changed.append(value)
+    return (DELTA_HEADER.pack(FRAME_MARKER, FRAME_DELTA, tick & 0xFFFFFFFF, tick - base_tick, mask)
+            + _delta_struct(mask).pack(*changed))
+
+
+def frame_size(buffer, start=0):
+    """
+    Size of the binary frame starting at buffer[start].
+
+    Returns:
+        Size in bytes, None if the header is not complete yet, or -1 for
+        an unknown frame kind
+    """
+    available = len(buffer) - start
+    if available < 2:
+        return None
+    kind = buffer[start + 1]
+    if kind == FRAME_SNAPSHOT:
+        return SNAPSHOT.size
+    if kind == FRAME_DELTA:
+        if available < DELTA_HEADER.size:
+            return None
+        mask = DELTA_HEADER.unpack_from(buffer, start)[4]
+        return DELTA_HEADER.size + sum(size for i, size in enumerate(_FIELD_SIZES) if mask >> i & 1)
+    return -1
+
+
+class SnapshotEncoder:
+    """
+    Server side of one binary client: full snapshots or deltas.
+
+    Deltas are relative to the newest snapshot the client acknowledged
+    (ACK,<tick>); a full keyframe goes out when there is no usable
+    baseline and at least every keyframe_interval ticks, so a client that
+    lost its baseline recovers.
+    """
+
+    def __init__(self, version, keyframe_interval=SNAPSHOT_KEYFRAME_INTERVAL):
+        self.version = version
+        self.keyframe_interval = keyframe_interval
+        self.sent = {}              # tick -> fields awaiting acknowledgement
+        self.baseline = None        # (tick, fields) last acknowledged
+        self.last_keyframe = None
+
+    def encode(self, fields, tick):
+        """Frame for the given wire fields at tick."""
+        if self.version < PROTOCOL_DELTA:
+            return encode_snapshot(fields, tick)
+
+        # Forget unacknowledged snapshots too old to be a baseline
+        while self.sent and next(iter(self.sent)) < tick - MAX_DELTA_AGE:
+            del self.sent[next(iter(self.sent))]
+        self.sent[tick] = fields
+
+        baseline = self.baseline
+        if (baseline is None or not 0 < tick - baseline[0] <= MAX_DELTA_AGE
+                or self.last_keyframe is None or tick - self.last_keyframe >= self.keyframe_interval):
+            self.last_keyframe = tick
+            return encode_snapshot(fields, tick)
+        return encode_delta(fields, tick, baseline[1], baseline[0])
+
+    def acknowledge(self, tick):
+        """Client has the snapshot for tick; use it as the baseline."""
+        fields = self.sent.get(tick)
+        if fields is None:
+            return
+        self.baseline = (tick, fields)
+        # Older snapshots can no longer become the baseline
+        for old in [t for t in self.sent if t <= tick]:
+            del self.sent[old]
+
+
+class SnapshotDecoder:
+    """Client side: rebuilds wire fields from full and delta frames."""
+
+    def __init__(self):
+        self.received = {}          # tick -> fields, recent ticks only
+
+    def decode(self, frame):
+        """
+        Decode a snapshot or delta frame.
+
+        Returns:
+            (fields, tick), or None if a delta's baseline is unknown
+        """
+        kind = frame[1]
+        if kind == FRAME_SNAPSHOT:
+            fields, tick = decode_snapshot(frame)
+        elif kind == FRAME_DELTA:
+            _, _, tick, age, mask = DELTA_HEADER.unpack_from(frame)
+            base = self.received.get(tick - age)
+            if base is None:
+                return None
+            changed = iter(_delta_struct(mask).unpack_from(frame, DELTA_HEADER.size))
+            fields = tuple(next(changed) if mask >> i & 1 else value
+                           for i, value in enumerate(base))
+        else:
+            return None
+
+        self.received[tick] = fields
+        while next(iter(self.received)) < tick - MAX_DELTA_AGE:
+            del self.received[next(iter(self.received))]
+        return fields, tick
+
+
+def read_messages(buffer):
+    """
+    Take complete messages off the front of a receive buffer.
+
+    Args:
+        buffer: bytearray of received data; consumed bytes are removed
+            in place, a trailing partial message is left for the next call
+
+    Returns:
+        List of messages: str for text lines, bytes for binary frames
+    """
+    messages = []
+    start = 0
+    end = len(buffer)
+    while start < end:
+        if buffer[start] == FRAME_MARKER:
+            size = frame_size(buffer, start)
+            if size is None:
+                break
+            if size < 0:
+                # Unknown frame kind: the rest of the stream can't be framed
+                start = end
+                break
+            if end - start < size:
+                break
+            messages.append(bytes(buffer[start:start + size]))
+            start += size
+        else:
+            newline = buffer.find(b'\n', start)
+            if newline < 0:
+                break
+            if newline > start:
+                messages.append(buffer[start:newline].decode(errors='replace'))
+            start = newline + 1
+    del buffer[:start]
+    return messages
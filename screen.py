@@ -0,0 +1,322 @@
+"""
+Screen Module
+Diff-based terminal output that only rewrites cells that changed since the last frame.
+"""
+
+import atexit
+import signal
+import threading
+
+import geometry
+import output
+from colors import SgrEncoder
+from text_metrics import ANSI_PATTERN, char_width
+
+
+RESET = "\033[0m"
+
+# Unchanged cells between two changed runs are rewritten instead of emitting
+# a new cursor move when the gap is at most this wide (a move costs ~8 bytes).
+MERGE_GAP = 4
+
+
+def split_cells(line):
+    """
+    Split a rendered line into terminal cells.
+
+    Args:
+        line: String that may contain SGR escape sequences
+
+    Returns:
+        List of (style, char) tuples, where style is the tuple of escape
+        codes active for that cell (() for default style). A wide glyph is
+        followed by a (style, '') continuation cell for its second column,
+        and zero-width characters are joined to the preceding cell.
+    """
+    cells = []
+    style = ()
+    pos = 0
+    for match in ANSI_PATTERN.finditer(line):
+        _append_cells(cells, style, line[pos:match.start()])
+        code = match.group()
+        if code == RESET:
+            style = ()
+        else:
+            style += (code,)
+        pos = match.end()
+    _append_cells(cells, style, line[pos:])
+    return cells
+
+
+def _append_cells(cells, style, text):
+    """Append one cell per terminal column of plain text."""
+    if text.isascii():
+        for char in text:
+            cells.append((style, char))
+        return
+    for char in text:
+        width = char_width(char)
+        if width == 1:
+            cells.append((style, char))
+        elif width == 2:
+            cells.append((style, char))
+            cells.append((style, ''))
+        elif cells:
+            prev_style, prev_char = cells[-1]
+            cells[-1] = (prev_style, prev_char + char)
+
+
+class Screen:
+    """
+    Keeps the last emitted frame and writes only the differences.
+
+    The first frame (or the first one after a resize or invalidate) is drawn
+    in full; every following frame only sends cursor moves plus the glyphs
+    of cells that changed.
+    """
+
+    def __init__(self, sink=None):
+        self.sink = sink
+        self._lines = []        # Last emitted line per terminal row
+        self._cells = {}        # Row index -> cached cells of that line
+        self._geometry_version = None
+        self._encoder = SgrEncoder()
+        self._staged = None
+        self.valid = False
+
+    def invalidate(self):
+        """Forget the last frame (terminal was cleared or written elsewhere)."""
+        self.valid = False
+
+    def _get_cells(self, y):
+        """Get (cached) cells of the last emitted line at row y."""
+        cells = self._cells.get(y)
+        if cells is None:
+            cells = split_cells(self._lines[y]) if y < len(self._lines) else []
+            self._cells[y] = cells
+        return cells
+
+    def _diff_row(self, y, old_cells, new_cells, out):
+        """Append escape sequences that turn old_cells into new_cells."""
+        old_len = len(old_cells)
+        new_len = len(new_cells)
+
+        # Find changed columns
+        changed = []
+        for x in range(new_len):
+            if x >= old_len or old_cells[x] != new_cells[x]:
+                changed.append(x)
+
+        # Group changed columns into runs, merging small gaps. A run never
+        # starts on the second column of a wide glyph.
+        runs = []
+        for x in changed:
+            if x > 0 and new_cells[x][1] == '':
+                x -= 1
+            if runs and x - runs[-1][1] <= MERGE_GAP + 1:
+                runs[-1][1] = max(runs[-1][1], x)
+            else:
+                runs.append([x, x])
+
+        # Cursor moves keep the style, so one encoder spans all runs
+        encoder = self._encoder
+        for start, end in runs:
+            out.append(f"\033[{y + 1};{start + 1}H")
+            run = new_cells[start:end + 1]
+            out.append(encoder.encode([char for _, char in run],
+                                      [style for style, _ in run]))
+
+        # Erase leftovers when the new line is shorter
+        if new_len < old_len:
+            out.append(f"\033[{y + 1};{new_len + 1}H{encoder.reset()}\033[K")
+
+    def render(self, lines):
+        """
+        Build the output needed to show lines on the terminal.
+
+        The result is staged; call commit() once it was actually written,
+        so a dropped frame is diffed again against what the terminal shows.
+
+        Args:
+            lines: List of rendered lines, one per terminal row from the top
+
+        Returns:
+            String of escape sequences and glyphs to write
+        """
+        version = geometry.get_version()
+
+        if not self.valid or version != self._geometry_version:
+            # Full redraw from the home position. Each line erases its own
+            # tail and the rest of the screen is erased last, so the
+            # terminal never shows an empty frame.
+            self._staged = (list(lines), None, version)
+            return "\033[H" + "\033[K\n".join(lines) + "\033[K\033[J"
+
+        out = []
+        new_cells_by_row = {}
+        old_lines = self._lines
+        rows = max(len(lines), len(old_lines))
+        for y in range(rows):
+            new = lines[y] if y < len(lines) else ""
+            old = old_lines[y] if y < len(old_lines) else ""
+            if new == old:
+                continue
+            new_cells = split_cells(new)
+            self._diff_row(y, self._get_cells(y), new_cells, out)
+            new_cells_by_row[y] = new_cells
+
+        self._staged = (list(lines), new_cells_by_row, version)
+        if not out:
+            return ""
+        out.append(self._encoder.reset())
+
+        # Park cursor below the frame
+        out.append(f"\033[{len(lines) + 1};1H")
+        return "".join(out)
+
+    def commit(self):
+        """Accept the last rendered frame as what the terminal now shows."""
+        if self._staged is None:
+            return
+        lines, new_cells_by_row, version = self._staged
+        self._staged = None
+        self._lines = lines
+        self._geometry_version = version
+        if new_cells_by_row is None:
+            self._cells = {}
+        else:
+            self._cells.update(new_cells_by_row)
+        self.valid = True
+
+    def present(self, lines):
+        """
+        Write the difference between the last frame and lines.
+
+        Returns:
+            bool: False if the sink dropped the frame (output still busy)
+        """
+        data = self.render(lines)
+        sink = self.sink or output.get_sink()
+        if data:
+            sink.write(data)
+        # Flush even an unchanged frame, so output still pending drains
+        if not sink.flush(droppable=self.valid):
+            self._staged = None
+            return False
+        self.commit()
+        return True
+
+
+# Shared screen used by the renderers
+_screen = Screen()
+
+
+def get_screen():
+    """Get the shared Screen instance."""
+    return _screen
+
+
+def present(lines):
+    """
+    Show lines on the shared screen, rewriting only changed cells.
+
+    Returns:
+        bool: False if the frame was dropped because output is still busy
+    """
+    return _screen.present(lines)
+
+
+def invalidate_screen():
+    """Force the next presented frame to be drawn in full."""
+    _screen.invalidate()
+
+
+# ============================================================================
+# FULL-SCREEN SESSION
+# ============================================================================
+
+ENTER_ALT_SCREEN = "\033[?1049h"
+LEAVE_ALT_SCREEN = "\033[?1049l"
+HIDE_CURSOR = "\033[?25l"
+SHOW_CURSOR = "\033[?25h"
+
+# Session currently owning the terminal (None outside full-screen mode)
+_active_session = None
+
+
+def set_cursor_visible(visible):
+    """Show or hide the cursor while a full-screen session is active (e.g. for input())."""
+    if _active_session is not None:
+        output.write(SHOW_CURSOR if visible else HIDE_CURSOR)
+
+
+class FullScreenSession:
+    """
+    Runs the UI on the alternate screen buffer with a hidden cursor.
+
+    The mode is entered once; frames are then drawn from the cursor home
+    position without erasing the screen. On exit, crash (atexit) or
+    SIGTERM the cursor, the main screen buffer and the saved terminal
+    mode are restored.
+
+    Usage:
+        with FullScreenSession():
+            run_menu()
+    """
+
+    def __init__(self):
+        self.active = False
+        self._previous_sigterm = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def open(self):
+        """Enter the alternate screen and hide the cursor."""
+        if self.active:
+            return
+        from input_handler import save_terminal
+        save_terminal()
+
+        global _active_session
+        output.write(ENTER_ALT_SCREEN + HIDE_CURSOR)
+        invalidate_screen()
+        self.active = True
+        _active_session = self
+        atexit.register(self.close)
+
+        if hasattr(signal, 'SIGTERM') and threading.current_thread() is threading.main_thread():
+            self._previous_sigterm = signal.signal(signal.SIGTERM, self._on_sigterm)
+
+    def close(self):
+        """Leave the alternate screen, show the cursor and restore the terminal mode."""
+        global _active_session
+        if not self.active:
+            return
+        self.active = False
+        if _active_session is self:
+            _active_session = None
+        from input_handler import restore_terminal
+
+        output.write(RESET + SHOW_CURSOR + LEAVE_ALT_SCREEN)
+        restore_terminal()
+        invalidate_screen()
+        atexit.unregister(self.close)
+
+        if self._previous_sigterm is not None and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self._previous_sigterm)
+            self._previous_sigterm = None
+
+    def _on_sigterm(self, signum, frame):
+        """Restore the terminal, then exit like the default handler would."""
+        previous = self._previous_sigterm
+        self.close()
+        if callable(previous):
+            previous(signum, frame)
+        else:
+            raise SystemExit(128 + signum)
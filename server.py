@@ -5,26 +5,66 @@ TCP Server that manages lobby and game with logging support.
 
 import socket
 import threading
-import time
 import logging
 
-from config import PORT, BUFFER_SIZE, FRAME_TIME, LOG_LEVEL, LOG_FORMAT
+from config import (
+    PORT, BUFFER_SIZE, LOG_LEVEL, LOG_FORMAT, GAME_WIDTH, GAME_HEIGHT,
+    ENABLE_BINARY_PROTOCOL
+)
 from game_state import GameState, LobbyState
 from physics import update_physics, move_paddle
+from timestep import FixedTimestep
+from clock import get_clock
+from protocol import PROTOCOL_VERSION, SnapshotEncoder, hello_message, parse_hello, snapshot_fields
 
 # Configure logging
 logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
 
+def get_local_ip():
+    """Get the local LAN IP address."""
+    try:
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        s.settimeout(1)
+        s.connect(("8.8.8.8", 80))
+        ip = s.getsockname()[0]
+        s.close()
+        return ip
+    except Exception as e:
+        logger.debug(f"Could not detect LAN IP: {e}")
+        return "127.0.0.1"
+
+
+def negotiate_version(message):
+    """Protocol version to use for a client's HELLO message (0 = text)."""
+    if not ENABLE_BINARY_PROTOCOL:
+        return 0
+    return min(parse_hello(message), PROTOCOL_VERSION)
+
+
+def lobby_state_message(lobby_state):
+    """LOBBY_STATE message for the current lobby."""
+    chat_data = lobby_state.serialize_chat()
+    p1 = "1" if lobby_state.players_connected[0] else "0"
+    p2 = "1" if lobby_state.players_connected[1] else "0"
+    lw = lobby_state.last_winner if lobby_state.last_winner else 0
+    ls1 = lobby_state.last_score1
+    ls2 = lobby_state.last_score2
+    return f"LOBBY_STATE,{p1},{p2},{lw},{ls1},{ls2},{chat_data}"
+
+
 class GameServer:
     """TCP Server that manages lobby and game."""
     
-    def __init__(self):
-        self.game_state = GameState()
+    def __init__(self, width=GAME_WIDTH, height=GAME_HEIGHT, clock=None):
+        self.clock = clock or get_clock()
+        self.game_state = GameState(width, height)
         self.lobby_state = LobbyState()
         self.clients = {}
         self.client_sockets = []
+        self.encoders = {}             # socket -> SnapshotEncoder (binary clients only)
+        self.tick = 0                  # Simulation ticks, never reset so snapshot ticks stay unique
         self.lock = threading.Lock()
         self.running = True
         self.in_lobby = True
@@ -34,16 +74,7 @@ class GameServer:
     
     def get_local_ip(self):
         """Get the local LAN IP address."""
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.settimeout(1)
-            s.connect(("8.8.8.8", 80))
-            ip = s.getsockname()[0]
-            s.close()
-            return ip
-        except Exception as e:
-            logger.debug(f"Could not detect LAN IP: {e}")
-            return "127.0.0.1"
+        return get_local_ip()
     
     def start(self):
         """Start the game server."""
@@ -123,7 +154,7 @@ class GameServer:
                 while '\n' in buffer:
                     message, buffer = buffer.split('\n', 1)
                     if message:
-                        self.process_message(message, player_id)
+                        self.process_message(message, player_id, client_socket)
                             
             except ConnectionResetError:
                 logger.warning(f"Player {player_id} connection reset")
@@ -138,17 +169,39 @@ class GameServer:
             self.lobby_state.players_connected[player_id - 1] = False
             if client_socket in self.client_sockets:
                 self.client_sockets.remove(client_socket)
+            self.encoders.pop(client_socket, None)
         
         try:
             client_socket.close()
         except:
             pass
     
-    def process_message(self, message, player_id):
+    def process_message(self, message, player_id, client_socket=None):
         """Process a single message from client."""
         logger.debug(f"P{player_id}: {message}")
         
-        if message.startswith("CHAT,"):
+        if message.startswith("HELLO,"):
+            version = negotiate_version(message)
+            # Reply before switching, so the client sees HELLO before any frame
+            self.send_to(client_socket, hello_message(version))
+            with self.lock:
+                if version:
+                    self.encoders[client_socket] = SnapshotEncoder(version)
+                else:
+                    self.encoders.pop(client_socket, None)
+            logger.info(f"Player {player_id} uses protocol version {version}")
+        
+        elif message.startswith("ACK,"):
+            try:
+                tick = int(message[4:])
+            except ValueError:
+                return
+            with self.lock:
+                encoder = self.encoders.get(client_socket)
+                if encoder:
+                    encoder.acknowledge(tick)
+        
+        elif message.startswith("CHAT,"):
             chat_msg = message[5:]
             with self.lock:
                 self.lobby_state.add_message(player_id, chat_msg)
@@ -183,16 +236,40 @@ class GameServer:
             if client in self.client_sockets:
                 self.client_sockets.remove(client)
     
+    def send_to(self, client_socket, message):
+        """Send a text message to one client."""
+        try:
+            client_socket.send((message + "\n").encode())
+        except Exception as e:
+            logger.debug(f"Send failed to client: {e}")
+    
+    def broadcast_state(self, text, frames):
+        """
+        Send a game state to all clients, in the format each negotiated.
+        
+        Args:
+            text: STATE text message (GameState.serialize) for text clients
+            frames: Binary frame per client socket (SnapshotEncoder.encode)
+        """
+        text_data = (text + "\n").encode()
+        disconnected = []
+        for client_socket in self.client_sockets:
+            data = frames.get(client_socket, text_data)
+            try:
+                client_socket.send(data)
+            except Exception as e:
+                logger.debug(f"Broadcast failed to client: {e}")
+                disconnected.append(client_socket)
+        
+        for client in disconnected:
+            if client in self.client_sockets:
+                self.client_sockets.remove(client)
+    
     def broadcast_lobby_state(self):
         """Send lobby state to all clients."""
         with self.lock:
-            chat_data = self.lobby_state.serialize_chat()
-            p1 = "1" if self.lobby_state.players_connected[0] else "0"
-            p2 = "1" if self.lobby_state.players_connected[1] else "0"
-            lw = self.lobby_state.last_winner if self.lobby_state.last_winner else 0
-            ls1 = self.lobby_state.last_score1
-            ls2 = self.lobby_state.last_score2
-        self.broadcast(f"LOBBY_STATE,{p1},{p2},{lw},{ls1},{ls2},{chat_data}")
+            message = lobby_state_message(self.lobby_state)
+        self.broadcast(message)
     
     def start_game(self):
         """Start the game from lobby."""
@@ -204,7 +281,7 @@ class GameServer:
             self.game_state.reset()
         
         self.broadcast("GAME_START")
-        time.sleep(0.5)
+        self.clock.sleep(0.5)
         
         self.run_game_loop()
         
@@ -218,30 +295,44 @@ class GameServer:
         
         logger.info(f"Game ended. Winner: Player {self.game_state.winner}")
         
-        time.sleep(3)
+        self.clock.sleep(3)
         self.broadcast("RETURN_LOBBY")
         self.broadcast_lobby_state()
     
     def run_game_loop(self):
-        """Main game physics loop."""
+        """
+        Main game physics loop.
+        
+        Physics runs on a fixed timestep; if the loop wakes late it catches
+        up with several steps and broadcasts only the latest state.
+        """
         logger.debug("Game loop started")
         
+        timestep = FixedTimestep()
+        timestep.advance(self.clock.now())
+        
         while self.game_state.running and self.running:
-            start_time = time.time()
+            self.clock.sleep(timestep.time_until_step())
+            steps = timestep.advance(self.clock.now())
+            if not steps:
+                continue
             
             with self.lock:
-                update_physics(self.game_state)
+                for _ in range(steps):
+                    update_physics(self.game_state)
+                    self.tick += 1
+                    if not self.game_state.running:
+                        break
                 state_data = self.game_state.serialize()
+                fields = snapshot_fields(self.game_state)
+                frames = {client_socket: encoder.encode(fields, self.tick)
+                          for client_socket, encoder in self.encoders.items()}
             
-            self.broadcast(state_data)
+            self.broadcast_state(state_data, frames)
             
             if not self.game_state.running:
                 self.broadcast(f"GAMEOVER,{self.game_state.winner}")
                 break
-            
-            elapsed = time.time() - start_time
-            if elapsed < FRAME_TIME:
-                time.sleep(FRAME_TIME - elapsed)
         
         logger.debug("Game loop ended")
     
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Headless Match Runner
+Plays complete AI vs AI matches as fast as the CPU allows (no TTY, no
+frame sleep) on a virtual clock, fanned out over a process pool, and
+reports win rates, rally lengths and throughput.
+
+Usage:
+    python simulate.py                              # 200 matches, hard vs medium
+    python simulate.py --matches 5000 --workers 8 --p1 hard --p2 hard
+    python simulate.py --no-powerups --field 300x100 --json
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from config import GAME_WIDTH, GAME_HEIGHT, TICK_TIME
+from game_state import GameState
+from physics import update_physics, move_paddle
+from powerups import PowerUpManager
+from ai import AIController
+from clock import VirtualClock
+
+
+# Matches still running after this many ticks are stopped as draws
+MAX_MATCH_TICKS = 200000
+
+
+def play_match(seed, p1='hard', p2='medium', width=GAME_WIDTH, height=GAME_HEIGHT,
+               powerups=True, max_ticks=MAX_MATCH_TICKS):
+    """
+    Play one AI vs AI match to the end.
+
+    The game runs on a VirtualClock: tick n happens at n * TICK_TIME
+    seconds, so power-up spawns and timers behave as in a real-time match.
+
+    Args:
+        seed: Random seed (the match is fully reproducible from it)
+        p1, p2: AIController difficulty per player
+        width, height: Field size
+        powerups: Whether power-ups spawn
+        max_ticks: Tick limit before the match is stopped as a draw
+
+    Returns:
+        Dict with winner (None for a draw), score1, score2, ticks and
+        rallies (paddle hits in each point, in order)
+    """
+    random.seed(seed)
+    state = GameState(width, height)
+    ai1 = AIController(p1, player_id=1)
+    ai2 = AIController(p2, player_id=2)
+    clock = VirtualClock()
+    powerup_manager = PowerUpManager(clock)
+    powerup_manager.enabled = powerups
+
+    rallies = []
+    hits = 0
+    tick = 0
+    while state.running and tick < max_ticks:
+        clock.set(tick * TICK_TIME)
+
+        move = ai1.update(state)
+        if move:
+            move_paddle(state, 1, move)
+        move = ai2.update(state)
+        if move:
+            move_paddle(state, 2, move)
+
+        events = update_physics(state, return_events=True)
+        if events.paddle1_hit or events.paddle2_hit:
+            hits += 1
+        if events.goal_scored:
+            rallies.append(hits)
+            hits = 0
+
+        powerup_manager.update(state, ball_path=events.ball_path)
+        tick += 1
+
+    return {
+        'seed': seed,
+        'winner': state.winner,
+        'score1': state.score1,
+        'score2': state.score2,
+        'ticks': tick,
+        'rallies': rallies,
+    }
+
+
+def _play_batch(seeds, options):
+    """Worker entry point: play the matches for a list of seeds."""
+    return [play_match(seed, **options) for seed in seeds]
+
+
+def run_matches(matches, workers=None, seed=0, chunk_size=None, **options):
+    """
+    Play matches in parallel and aggregate the results.
+
+    Args:
+        matches: Number of matches
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+        seed: Seed of the first match; match i uses seed + i
+        chunk_size: Matches sent to a worker at a time
+        **options: Passed to play_match (p1, p2, width, height, powerups, max_ticks)
+
+    Returns:
+        Dict of aggregate statistics (see summarize)
+    """
+    workers = workers or os.cpu_count() or 1
+    seeds = list(range(seed, seed + matches))
+    if chunk_size is None:
+        chunk_size = max(1, matches // (workers * 4))
+    chunks = [seeds[i:i + chunk_size] for i in range(0, matches, chunk_size)]
+
+    start = time.perf_counter()
+    results = []
+    if workers == 1:
+        for chunk in chunks:
+            results.extend(_play_batch(chunk, options))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for batch in pool.map(_play_batch, chunks, [options] * len(chunks)):
+                results.extend(batch)
+    elapsed = time.perf_counter() - start
+
+    summary = summarize(results, elapsed)
+    summary['workers'] = workers
+    summary['options'] = options
+    return summary
+
+
+def summarize(results, elapsed):
+    """
+    Aggregate match results.
+
+    Returns:
+        Dict with matches, wins/win rates per player, draws, rally length
+        statistics, ticks per match, matches/sec and ticks/sec
+    """
+    count = len(results)
+    wins1 = sum(1 for r in results if r['winner'] == 1)
+    wins2 = sum(1 for r in results if r['winner'] == 2)
+    rallies = [length for r in results for length in r['rallies']]
+    ticks = [r['ticks'] for r in results]
+    total_ticks = sum(ticks)
+
+    return {
+        'matches': count,
+        'wins1': wins1,
+        'wins2': wins2,
+        'draws': count - wins1 - wins2,
+        'win_rate1': wins1 / count if count else 0.0,
+        'win_rate2': wins2 / count if count else 0.0,
+        'points': len(rallies),
+        'rally_mean': statistics.mean(rallies) if rallies else 0.0,
+        'rally_median': statistics.median(rallies) if rallies else 0.0,
+        'rally_max': max(rallies) if rallies else 0,
+        'ticks_mean': statistics.mean(ticks) if ticks else 0.0,
+        'elapsed': elapsed,
+        'matches_per_sec': count / elapsed if elapsed > 0 else float('inf'),
+        'ticks_per_sec': total_ticks / elapsed if elapsed > 0 else float('inf'),
+    }
+
+
+def main():
+    difficulties = sorted(AIController.DIFFICULTY_SETTINGS)
+    parser = argparse.ArgumentParser(description="Run headless Terminal Pong AI matches")
+    parser.add_argument('--matches', type=int, default=200, help="number of matches")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first match")
+    parser.add_argument('--p1', choices=difficulties, default='hard', help="player 1 AI difficulty")
+    parser.add_argument('--p2', choices=difficulties, default='medium', help="player 2 AI difficulty")
+    parser.add_argument('--field', default=f"{GAME_WIDTH}x{GAME_HEIGHT}",
+                        help="field size as WIDTHxHEIGHT")
+    parser.add_argument('--no-powerups', action='store_true', help="disable power-ups")
+    parser.add_argument('--max-ticks', type=int, default=MAX_MATCH_TICKS, help="tick limit per match")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args()
+
+    width, height = (int(n) for n in args.field.lower().split('x'))
+    summary = run_matches(
+        args.matches, workers=args.workers, seed=args.seed,
+        p1=args.p1, p2=args.p2, width=width, height=height,
+        powerups=not args.no_powerups, max_ticks=args.max_ticks,
+    )
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+
+    print(f"{summary['matches']} matches, P1 {args.p1} vs P2 {args.p2}, "
+          f"{summary['workers']} workers")
+    print(f"  P1 wins: {summary['wins1']:>6}  ({summary['win_rate1']:.1%})")
+    print(f"  P2 wins: {summary['wins2']:>6}  ({summary['win_rate2']:.1%})")
+    print(f"  Draws:   {summary['draws']:>6}")
+    print(f"  Rally length (hits): mean {summary['rally_mean']:.2f}, "
+          f"median {summary['rally_median']}, max {summary['rally_max']}")
+    print(f"  Ticks per match: {summary['ticks_mean']:.0f}")
+    print(f"  {summary['matches_per_sec']:.1f} matches/sec, "
+          f"{summary['ticks_per_sec']:.0f} ticks/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Text Metrics Module
+ANSI-aware visible length, padding and centering with memoization.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+
+# Matches SGR escape sequences (colors/styles)
+ANSI_PATTERN = re.compile(r'\033\[[0-9;]*m')
+
+# Same pattern with a group, so re.split keeps the escape sequences
+_ANSI_SPLIT_PATTERN = re.compile(r'(\033\[[0-9;]*m)')
+
+# Format characters that take no column: zero width space, zero width
+# non-joiner, zero width joiner, variation selector-16 (emoji style)
+ZERO_WIDTH_CHARS = frozenset('\u200b\u200c\u200d\ufe0f')
+
+
+@lru_cache(maxsize=1024)
+def char_width(char):
+    """
+    Get the number of terminal columns a character occupies.
+
+    Returns:
+        0 for combining/zero-width characters, 2 for wide (East Asian
+        wide/fullwidth, most emoji), 1 otherwise
+    """
+    if unicodedata.combining(char) or char in ZERO_WIDTH_CHARS:
+        return 0
+    if unicodedata.east_asian_width(char) in ('W', 'F'):
+        return 2
+    return 1
+
+
+def strip_ansi(text):
+    """Remove ANSI escape sequences from text."""
+    return ANSI_PATTERN.sub('', text)
+
+
+@lru_cache(maxsize=4096)
+def visible_len(text):
+    """Get the number of terminal columns text occupies, ignoring ANSI codes."""
+    visible = ANSI_PATTERN.sub('', text) if '\033' in text else text
+    if visible.isascii():
+        return len(visible)
+    return sum(char_width(char) for char in visible)
+
+
+@lru_cache(maxsize=4096)
+def pad(text, width):
+    """Pad text with spaces on the right to width visible columns."""
+    padding = width - visible_len(text)
+    if padding > 0:
+        return text + ' ' * padding
+    return text
+
+
+@lru_cache(maxsize=4096)
+def center(text, width):
+    """Center text within width by left-padding with spaces."""
+    padding = max(0, (width - visible_len(text)) // 2)
+    return ' ' * padding + text
+
+
+def truncate(text, width, ellipsis="..."):
+    """
+    Truncate text to width visible columns, keeping ANSI codes intact.
+
+    Returns text unchanged if it already fits.
+    """
+    if visible_len(text) <= width:
+        return text
+    limit = max(0, width - len(ellipsis))
+    parts = []
+    used = 0
+    # Odd indices of the split are escape sequences
+    for i, chunk in enumerate(_ANSI_SPLIT_PATTERN.split(text)):
+        if i % 2:
+            parts.append(chunk)
+            continue
+        for char in chunk:
+            w = char_width(char)
+            if used + w > limit:
+                return ''.join(parts) + '\033[0m' + ellipsis
+            parts.append(char)
+            used += w
+    return ''.join(parts) + ellipsis
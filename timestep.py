@@ -0,0 +1,69 @@
+"""
+Timestep Module
+Fixed-timestep accumulator that decouples the simulation rate from the
+render (or broadcast) rate.
+"""
+
+from config import TICK_TIME, MAX_TICKS_PER_FRAME
+
+# An accumulator this close to a whole step counts as the step (summed
+# float time can fall just short, and a sleep for the remainder may be
+# too small to move a virtual clock at all)
+STEP_EPSILON = 1e-9
+
+
+class FixedTimestep:
+    """
+    Turns elapsed time into a whole number of fixed simulation steps.
+
+    Each call to advance() adds the time since the previous call to an
+    accumulator and returns how many steps are due; the leftover fraction
+    of a step is available as `alpha` for render interpolation.
+    """
+
+    def __init__(self, step=TICK_TIME, max_steps=MAX_TICKS_PER_FRAME):
+        """
+        Args:
+            step: Simulation step in seconds
+            max_steps: Most steps run per advance(); a longer backlog is
+                dropped so a stall cannot snowball into ever longer frames
+        """
+        self.step = step
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.ticks = 0            # Steps handed out so far
+        self._last_time = None
+
+    @property
+    def alpha(self):
+        """Fraction of a step accumulated since the last step (0..1)."""
+        return min(1.0, self.accumulator / self.step)
+
+    def advance(self, now):
+        """
+        Add the time since the last call.
+
+        Args:
+            now: Current time in seconds
+
+        Returns:
+            int: Number of simulation steps to run now
+        """
+        if self._last_time is None:
+            self._last_time = now
+            return 0
+        self.accumulator += max(0.0, now - self._last_time)
+        self._last_time = now
+
+        steps = int((self.accumulator + STEP_EPSILON) / self.step)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator = max(0.0, self.accumulator - steps * self.step)
+        self.ticks += steps
+        return steps
+
+    def time_until_step(self):
+        """Seconds until the next step is due."""
+        return max(0.0, self.step - self.accumulator)
@@ -3,8 +3,10 @@ UI Components Module
 Reusable ASCII/Unicode UI components for terminal rendering.
 """
 
-import shutil
-from colors import Style, colorize, COLORS_ENABLED
+import colors
+import geometry
+from colors import Style, colorize, bold, dim, COLORS_ENABLED
+from text_metrics import visible_len, pad, center
 
 # Try to import pyfiglet for ASCII art generation
 try:
@@ -147,12 +149,8 @@ def get_symbol(name):
 
 
 def get_terminal_size():
-    """Get terminal dimensions."""
-    try:
-        cols, rows = shutil.get_terminal_size()
-        return cols, rows
-    except:
-        return 80, 24  # Default fallback
+    """Get terminal dimensions (cached, refreshed on resize)."""
+    return geometry.get_size()
 
 
 def get_responsive_width(min_width=40, max_width=100, margin=4):
@@ -192,11 +190,7 @@ def get_game_display_width():
 
 def center_text(text, width):
     """Center text within given width."""
-    # Strip ANSI codes for length calculation
-    import re
-    visible_text = re.sub(r'\033\[[0-9;]*m', '', text)
-    padding = max(0, (width - len(visible_text)) // 2)
-    return " " * padding + text
+    return center(text, width)
 
 
 def center_block(content_lines):
@@ -233,11 +227,8 @@ def center_block(content_lines):
     result.extend([''] * v_padding)
     
     # Add horizontally centered lines
-    import re
     for line in content_lines:
-        visible_len = len(re.sub(r'\033\[[0-9;]*m', '', line))
-        h_padding = max(0, (cols - visible_len) // 2)
-        result.append(" " * h_padding + line)
+        result.append(center(line, cols))
         
     return result
 
@@ -286,10 +277,7 @@ def draw_box_middle(content, width, style='single', color=None):
     else:
         v = get_box_char('v')
     
-    # Strip ANSI for length calculation
-    import re
-    visible_content = re.sub(r'\033\[[0-9;]*m', '', content)
-    padding = width - 2 - len(visible_content)
+    padding = width - 2 - visible_len(content)
     
     line = v + content + " " * padding + v
     if color and COLORS_ENABLED:
@@ -391,6 +379,90 @@ def title_banner(text, style='double'):
     return "\n".join(lines)
 
 
+# ============================================================================
+# GAME SCREEN LAYOUT CACHE
+# ============================================================================
+
+class GameLayout:
+    """
+    Precomputed chrome and centering offsets for the game screen.
+    
+    The game frame is: score line, top border, field rows, bottom border,
+    controls line. Everything except the score line and the field rows is
+    static for a given terminal size, so it is built once here and the
+    renderer only fills in the dynamic rows of `frame`.
+    """
+    
+    def __init__(self, field_width, field_height, cols, rows):
+        self.field_width = field_width
+        self.field_height = field_height
+        self.cols = cols
+        
+        frame_width = field_width + 2
+        content_height = field_height + 4
+        
+        # Same offsets center_block() would compute
+        v_padding = max(0, (rows - content_height) // 2)
+        self.left = " " * max(0, (cols - frame_width) // 2)
+        
+        top_border = get_box_char('tl') + get_box_char('h') * field_width + get_box_char('tr')
+        bottom_border = get_box_char('bl') + get_box_char('h') * field_width + get_box_char('br')
+        side = colorize(get_box_char('v'), Style.DIM)
+        self.row_prefix = self.left + side
+        self.row_suffix = side
+        
+        controls = f"  Controls: {bold('[W]')} Up  {bold('[S]')} Down  |  {dim('[Q] Quit')}"
+        controls = pad(controls, frame_width)
+        
+        # Frame lines, reused every frame (dynamic rows are overwritten)
+        self.score_index = v_padding
+        self.field_index = v_padding + 2
+        self.frame = [''] * v_padding
+        self.frame.append('')
+        self.frame.append(self.left + colorize(top_border, Style.DIM))
+        self.frame.extend([''] * field_height)
+        self.frame.append(self.left + colorize(bottom_border, Style.DIM))
+        self.frame.append(self.center_line(controls))
+    
+    def center_line(self, line):
+        """Center a line horizontally (like center_block) for this terminal width."""
+        return center(line, self.cols)
+    
+    def set_score_line(self, line):
+        """Place the (padded) score line into the frame."""
+        self.frame[self.score_index] = self.center_line(line)
+    
+    def set_field_rows(self, rows):
+        """Place encoded field rows into the frame between the side borders."""
+        frame = self.frame
+        prefix = self.row_prefix
+        suffix = self.row_suffix
+        index = self.field_index
+        for row in rows:
+            frame[index] = prefix + row + suffix
+            index += 1
+
+
+_game_layout = None
+_game_layout_key = None
+
+
+def get_game_layout(field_width, field_height):
+    """
+    Get the cached GameLayout for the current terminal.
+    
+    The layout is rebuilt when the terminal geometry version, Unicode or
+    color setting (or the field size) changes.
+    """
+    global _game_layout, _game_layout_key
+    key = (geometry.get_version(), UNICODE_ENABLED, colors.COLORS_ENABLED, field_width, field_height)
+    if key != _game_layout_key:
+        cols, rows = get_terminal_size()
+        _game_layout = GameLayout(field_width, field_height, cols, rows)
+        _game_layout_key = key
+    return _game_layout
+
+
 # ASCII Art title for PONG
 PONG_TITLE = """
 ╔═══════════════════════════════════════════════════════════════╗